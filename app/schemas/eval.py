@@ -21,7 +21,7 @@ class EvalJobCreate(BaseModel):
     model_id: str
     adapter_id: str | None = None
     dataset_id: str
-    config: EvalConfig = EvalConfig()
+    config: EvalConfig = Field(default_factory=EvalConfig)
 
 
 class EvalMetricResult(BaseModel):
@@ -24,6 +24,15 @@ def _tokenize(text: str) -> list[str]:
     return text.lower().split()
 
 
+def _ngram_counts(text: str, max_n: int) -> tuple[int, tuple[Counter, ...]]:
+    """Token count and 1..max_n-gram Counters for a text."""
+    tokens = _tokenize(text)
+    counts = tuple(
+        Counter(zip(*(tokens[i:] for i in range(n)))) for n in range(1, max_n + 1)
+    )
+    return len(tokens), counts
+
+
 # ── Metrics ───────────────────────────────────────────────────────────────────
 
 
@@ -56,27 +65,20 @@ def f1_score(generated: str, expected: str) -> float:
 
 def bleu_score(generated: str, expected: str, max_n: int = 4) -> float:
     """BLEU-4 score with simple tokenization (no nltk)."""
-    gen_tokens = _tokenize(generated)
-    ref_tokens = _tokenize(expected)
+    gen_len, gen_counts = _ngram_counts(generated, max_n)
+    ref_len, ref_counts = _ngram_counts(expected, max_n)
 
-    if not gen_tokens or not ref_tokens:
-        return 1.0 if not gen_tokens and not ref_tokens else 0.0
+    if not gen_len or not ref_len:
+        return 1.0 if not gen_len and not ref_len else 0.0
 
     # n-gram precisions
     precisions = []
-    for n in range(1, max_n + 1):
-        gen_ngrams = Counter(
-            tuple(gen_tokens[i : i + n]) for i in range(len(gen_tokens) - n + 1)
-        )
-        ref_ngrams = Counter(
-            tuple(ref_tokens[i : i + n]) for i in range(len(ref_tokens) - n + 1)
-        )
-
+    for gen_ngrams, ref_ngrams in zip(gen_counts, ref_counts):
         if not gen_ngrams:
             precisions.append(0.0)
             continue
 
-        clipped = sum(min(gen_ngrams[ng], ref_ngrams.get(ng, 0)) for ng in gen_ngrams)
+        clipped = sum(min(count, ref_ngrams[ng]) for ng, count in gen_ngrams.items())
         precisions.append(clipped / sum(gen_ngrams.values()))
 
     # If any precision is zero, BLEU is zero
@@ -88,12 +90,34 @@ def bleu_score(generated: str, expected: str, max_n: int = 4) -> float:
 
     # Brevity penalty
     bp = 1.0
-    if len(gen_tokens) < len(ref_tokens):
-        bp = math.exp(1 - len(ref_tokens) / len(gen_tokens))
+    if gen_len < ref_len:
+        bp = math.exp(1 - ref_len / gen_len)
 
     return bp * math.exp(log_avg)
 
 
+def _lcs_length(a: list[str], b: list[str]) -> int:
+    """Longest common subsequence length, bit-parallel over positions in ``a``.
+
+    Each bit of ``row`` tracks one position of ``a`` (Allison-Dix / Hyyrö),
+    so a token of ``b`` is folded in with a few big-int ops instead of an
+    O(len(a)) inner loop. Python ints have no width cap, so any length works.
+    """
+    match: dict[str, int] = {}
+    for i, tok in enumerate(a):
+        match[tok] = match.get(tok, 0) | (1 << i)
+
+    mask = (1 << len(a)) - 1
+    row = mask
+    for tok in b:
+        m = match.get(tok)
+        if m is None:
+            continue
+        u = row & m
+        row = ((row + u) | (row - u)) & mask
+    return len(a) - row.bit_count()
+
+
 def rouge_l(generated: str, expected: str) -> float:
     """ROUGE-L: longest common subsequence F1."""
     gen_tokens = _tokenize(generated)
@@ -102,22 +126,12 @@ def rouge_l(generated: str, expected: str) -> float:
     if not gen_tokens or not ref_tokens:
         return 1.0 if not gen_tokens and not ref_tokens else 0.0
 
-    # LCS length via DP
-    m, n = len(ref_tokens), len(gen_tokens)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if ref_tokens[i - 1] == gen_tokens[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-
-    lcs_len = dp[m][n]
+    lcs_len = _lcs_length(ref_tokens, gen_tokens)
     if lcs_len == 0:
         return 0.0
 
-    precision = lcs_len / n
-    recall = lcs_len / m
+    precision = lcs_len / len(gen_tokens)
+    recall = lcs_len / len(ref_tokens)
     return 2 * precision * recall / (precision + recall)
 
 
@@ -146,17 +160,12 @@ def score_example(
     metrics: list[str],
 ) -> dict[str, float]:
     """Score a single example across the requested metrics."""
-    scores = {}
-    for metric in metrics:
-        fn = METRIC_FUNCTIONS.get(metric)
-        if fn is None:
-            continue
-        if expected is None:
-            # Can't compute comparison metrics without expected
-            scores[metric] = 0.0
-        else:
-            scores[metric] = fn(generated, expected)
-    return scores
+    if expected is None:
+        # Can't compute comparison metrics without expected
+        return {m: 0.0 for m in metrics if m in METRIC_FUNCTIONS}
+    return {
+        m: METRIC_FUNCTIONS[m](generated, expected) for m in metrics if m in METRIC_FUNCTIONS
+    }
 
 
 # ── Confidence Intervals ──────────────────────────────────────────────────────
@@ -3,6 +3,7 @@
 import hashlib
 import io
 import json
+import os
 import struct
 import zipfile
 from pathlib import Path
@@ -154,10 +155,11 @@ class FileIntegrityStage(PipelineStage):
 
     def _validate_pdf(self, file_path: Path) -> list[StageFinding]:
         findings = []
-        content = file_path.read_bytes()
+        with open(file_path, "rb") as f:
+            magic_bytes = f.read(4)
 
         # Check PDF magic bytes
-        if not content.startswith(b"%PDF"):
+        if magic_bytes != b"%PDF":
             findings.append(StageFinding(
                 stage=self.name,
                 severity="high",
@@ -290,9 +292,16 @@ class FileIntegrityStage(PipelineStage):
     def _validate_safetensors(self, file_path: Path) -> list[StageFinding]:
         """Validate safetensors header structure (first 8 bytes = little-endian uint64 header size)."""
         findings = []
-        content = file_path.read_bytes()
-
-        if len(content) < 8:
+        # Only the 8-byte length prefix and the JSON header are inspected, so
+        # never pull multi-GB tensor data into memory.
+        with open(file_path, "rb") as f:
+            prefix = f.read(8)
+            body_size = os.fstat(f.fileno()).st_size - 8
+            if len(prefix) == 8:
+                header_size = struct.unpack("<Q", prefix)[0]
+                header_bytes = f.read(header_size) if header_size <= body_size else b""
+
+        if len(prefix) < 8:
             findings.append(StageFinding(
                 stage=self.name,
                 severity="high",
@@ -301,10 +310,8 @@ class FileIntegrityStage(PipelineStage):
             ))
             return findings
 
-        header_size = struct.unpack("<Q", content[:8])[0]
-
         # Sanity check: header shouldn't be larger than the file
-        if header_size > len(content) - 8:
+        if header_size > body_size:
             findings.append(StageFinding(
                 stage=self.name,
                 severity="high",
@@ -315,7 +322,7 @@ class FileIntegrityStage(PipelineStage):
 
         # Try to parse header as JSON
         try:
-            header_json = content[8:8 + header_size].decode("utf-8")
+            header_json = header_bytes.decode("utf-8")
             header = json.loads(header_json)
             # Check for suspicious keys that might indicate pickle embedding
             if "__metadata__" in header:
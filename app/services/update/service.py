@@ -31,6 +31,16 @@ UPDATE_DEFAULTS = {
 }
 
 
+def _load_json_list(raw: str | None) -> list:
+    """Decode a JSON list column, treating empty or corrupt values as []."""
+    if not raw:
+        return []
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return []
+
+
 class UpdateService:
     """Orchestrates the update lifecycle: scan, verify, apply, rollback."""
 
@@ -108,13 +118,9 @@ class UpdateService:
         rollback_available = self._directory.has_rollback()
         rollback_version = None
         if rollback_available:
-            version_file = self._directory.rollback / "version.json"
-            if version_file.exists():
-                try:
-                    data = json.loads(version_file.read_text())
-                    rollback_version = data.get("version")
-                except (json.JSONDecodeError, OSError):
-                    pass
+            data = self._read_rollback_metadata()
+            if data is not None:
+                rollback_version = data.get("version")
 
         return {
             "current_version": current_version,
@@ -288,20 +294,6 @@ class UpdateService:
         if not job:
             raise NotFoundError(f"Update job '{job_id}' not found.")
 
-        steps = []
-        if job.steps_json:
-            try:
-                steps = json.loads(job.steps_json)
-            except json.JSONDecodeError:
-                pass
-
-        log_entries = []
-        if job.log_json:
-            try:
-                log_entries = json.loads(job.log_json)
-            except json.JSONDecodeError:
-                pass
-
         return {
             "job_id": job.id,
             "status": job.status,
@@ -309,8 +301,8 @@ class UpdateService:
             "from_version": job.from_version,
             "progress_pct": job.progress_pct,
             "current_step": job.current_step,
-            "steps": steps,
-            "log_entries": log_entries,
+            "steps": _load_json_list(job.steps_json),
+            "log_entries": _load_json_list(job.log_json),
             "error": job.error,
             "started_at": job.started_at.isoformat() if job.started_at else None,
             "completed_at": job.completed_at.isoformat() if job.completed_at else None,
@@ -318,6 +310,17 @@ class UpdateService:
 
     # ── Rollback ─────────────────────────────────────────────────────────────
 
+    def _read_rollback_metadata(self) -> dict | None:
+        """Parsed rollback snapshot version.json, or None if missing or unreadable.
+
+        Reads directly and treats a missing file as an OSError rather than
+        stat-ing first, so the common path is a single open().
+        """
+        try:
+            return json.loads((self._directory.rollback / "version.json").read_bytes())
+        except (json.JSONDecodeError, OSError):
+            return None
+
     async def rollback(
         self,
         confirmation: str,
@@ -347,15 +350,10 @@ class UpdateService:
 
         current_version = await self._get_config_value("update.current_version")
 
-        # Read rollback version
-        version_file = self._directory.rollback / "version.json"
         rollback_version = "unknown"
-        if version_file.exists():
-            try:
-                data = json.loads(version_file.read_text())
-                rollback_version = data.get("version", "unknown")
-            except (json.JSONDecodeError, OSError):
-                pass
+        data = self._read_rollback_metadata()
+        if data is not None:
+            rollback_version = data.get("version", "unknown")
 
         job_id = str(uuid.uuid4())
 
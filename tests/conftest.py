@@ -3,29 +3,88 @@ import asyncio
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.core.database import ApiKey, Base
 from app.core.security import generate_api_key, hash_api_key, get_key_prefix
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Run the session event loop on uvloop where uvicorn[standard] installed it."""
+    try:
+        import uvloop
+    except ImportError:  # Windows / PyPy: uvicorn[standard] skips uvloop
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest_asyncio.fixture
 async def db_engine():
-    """In-memory SQLite engine for tests."""
+    """In-memory SQLite engine for tests.
+
+    aiosqlite pins ``:memory:`` to a single StaticPool connection, so commits
+    never touch disk and every test gets a fresh, private database. Being
+    fresh, it skips create_all's per-table existence probes.
+    """
     engine = create_async_engine("sqlite+aiosqlite://", echo=False)
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(Base.metadata.create_all, checkfirst=False)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_engine():
+    """Session-wide in-memory engine; DDL runs once for the whole run.
+
+    The sqlite3 driver defers BEGIN and ignores SAVEPOINT boundaries, so take
+    over transaction control to make the per-test rollback below real.
+    StaticPool is spelled out because every test must land on the one
+    connection that holds the schema.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_conn, _record):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, checkfirst=False)
     yield engine
     await engine.dispose()
 
 
+@pytest_asyncio.fixture
+async def rollback_session_factory(shared_engine):
+    """Session factory joined to an outer transaction that is rolled back.
+
+    Sessions commit into a SAVEPOINT on the shared connection, so services
+    that open and commit their own sessions see each other's writes, and
+    teardown discards all of it without re-running DDL.
+    """
+    async with shared_engine.connect() as conn:
+        trans = await conn.begin()
+        yield async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        await trans.rollback()
+
+
 @pytest_asyncio.fixture
 async def db_session(db_engine):
     """Async session bound to the in-memory engine."""
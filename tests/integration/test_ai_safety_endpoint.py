@@ -70,15 +70,22 @@ async def admin_client(ai_safety_app, db_engine):
         yield client
 
 
-async def _poll_job(client, job_id, max_wait=10):
-    """Poll scan job until completed or timeout."""
-    for _ in range(max_wait * 10):
+async def _poll_job(client, job_id, timeout=60.0):
+    """Poll scan job until completed; fail with the last status on timeout.
+
+    The deadline is generous because under ``pytest -n`` the scan runs
+    while other workers load the same CPU.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
         resp = await client.get(f"/vault/quarantine/scan/{job_id}")
         data = resp.json()
         if data["status"] == "completed":
             return data
+        if loop.time() >= deadline:
+            pytest.fail(f"scan job {job_id} still '{data['status']}' after {timeout}s")
         await asyncio.sleep(0.1)
-    return data
 
 
 class TestAISafetyPipeline:
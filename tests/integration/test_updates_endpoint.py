@@ -9,6 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.database import ApiKey, UpdateJob
 from app.core.security import generate_api_key, hash_api_key, get_key_prefix
+from app.services.update.directory import UpdateDirectory
+from app.services.update.service import UpdateService
 
 
 # ── Fixtures ─────────────────────────────────────────────────────────────────
@@ -16,10 +18,12 @@ from app.core.security import generate_api_key, hash_api_key, get_key_prefix
 
 @pytest_asyncio.fixture
 async def updates_app(app_with_db, db_engine, tmp_path):
-    """App with update service wired to tmp directories."""
-    from app.services.update.directory import UpdateDirectory
-    from app.services.update.service import UpdateService
+    """App with update service wired to tmp directories.
 
+    Deliberately function-scoped: apply/rollback tests start background
+    engine tasks that can outlive the test and rewrite the rollback
+    directory, so each test gets its own tree.
+    """
     session_factory = async_sessionmaker(
         db_engine, class_=AsyncSession, expire_on_commit=False
     )
@@ -108,18 +112,6 @@ class TestUpdateStatus:
         assert data["rollback_version"] is None
         assert data["update_count"] == 0
 
-    @pytest.mark.asyncio
-    async def test_status_requires_admin(self, user_client):
-        """User-scoped key gets 403 on status endpoint."""
-        response = await user_client.get("/vault/updates/status")
-        assert response.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_status_requires_auth(self, anon_updates_client):
-        """Unauthenticated request gets 401."""
-        response = await anon_updates_client.get("/vault/updates/status")
-        assert response.status_code == 401
-
 
 # ── TestScanForUpdates ───────────────────────────────────────────────────────
 
@@ -134,12 +126,6 @@ class TestScanForUpdates:
         assert data["found"] is False
         assert data["bundles"] == []
 
-    @pytest.mark.asyncio
-    async def test_scan_requires_admin(self, user_client):
-        """User-scoped key gets 403 on scan endpoint."""
-        response = await user_client.post("/vault/updates/scan")
-        assert response.status_code == 403
-
 
 # ── TestPendingUpdate ────────────────────────────────────────────────────────
 
@@ -153,12 +139,6 @@ class TestPendingUpdate:
         data = response.json()
         assert data["error"]["code"] == "not_found"
 
-    @pytest.mark.asyncio
-    async def test_pending_requires_admin(self, user_client):
-        """User-scoped key gets 403 on pending endpoint."""
-        response = await user_client.get("/vault/updates/pending")
-        assert response.status_code == 403
-
     @pytest.mark.asyncio
     async def test_pending_returns_404_after_empty_scan(self, admin_client):
         """After a scan with no bundles found, pending still returns 404."""
@@ -193,15 +173,6 @@ class TestApplyUpdate:
         data = response.json()
         assert data["error"]["code"] == "no_pending_update"
 
-    @pytest.mark.asyncio
-    async def test_apply_requires_admin(self, user_client):
-        """User-scoped key gets 403 on apply endpoint."""
-        response = await user_client.post(
-            "/vault/updates/apply",
-            json={"confirmation": "APPLY UPDATE"},
-        )
-        assert response.status_code == 403
-
     @pytest.mark.asyncio
     async def test_apply_returns_202_and_job_id(self, admin_client, updates_app):
         """With a pending compatible bundle, apply returns 202 with job_id."""
@@ -271,33 +242,22 @@ class TestProgress:
         assert data["error"]["code"] == "not_found"
 
     @pytest.mark.asyncio
-    async def test_progress_requires_admin(self, user_client):
-        """User-scoped key gets 403 on progress endpoint."""
-        response = await user_client.get("/vault/updates/progress/some-job-id")
-        assert response.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_progress_returns_job_data(self, admin_client, db_engine):
+    async def test_progress_returns_job_data(self, admin_client, db_session):
         """GET /vault/updates/progress/{job_id} returns progress for an existing job."""
-        session_factory = async_sessionmaker(
-            db_engine, class_=AsyncSession, expire_on_commit=False
-        )
-        async with session_factory() as session:
-            job = UpdateJob(
-                id="test-progress-123",
-                status="completed",
-                bundle_version="1.2.0",
-                from_version="1.0.0",
-                progress_pct=100,
-                current_step="health_checking",
-                steps_json=json.dumps([
-                    {"name": "extract_bundle", "status": "completed"},
-                    {"name": "health_checking", "status": "completed"},
-                ]),
-                log_json=json.dumps(["Step 1 done", "Step 2 done"]),
-            )
-            session.add(job)
-            await session.commit()
+        db_session.add(UpdateJob(
+            id="test-progress-123",
+            status="completed",
+            bundle_version="1.2.0",
+            from_version="1.0.0",
+            progress_pct=100,
+            current_step="health_checking",
+            steps_json=json.dumps([
+                {"name": "extract_bundle", "status": "completed"},
+                {"name": "health_checking", "status": "completed"},
+            ]),
+            log_json=json.dumps(["Step 1 done", "Step 2 done"]),
+        ))
+        await db_session.commit()
 
         response = await admin_client.get("/vault/updates/progress/test-progress-123")
         assert response.status_code == 200
@@ -312,21 +272,16 @@ class TestProgress:
         assert len(data["log_entries"]) == 2
 
     @pytest.mark.asyncio
-    async def test_progress_returns_pending_job(self, admin_client, db_engine):
+    async def test_progress_returns_pending_job(self, admin_client, db_session):
         """Progress endpoint works for a pending job with no steps yet."""
-        session_factory = async_sessionmaker(
-            db_engine, class_=AsyncSession, expire_on_commit=False
-        )
-        async with session_factory() as session:
-            job = UpdateJob(
-                id="test-pending-456",
-                status="pending",
-                bundle_version="1.3.0",
-                from_version="1.0.0",
-                progress_pct=0,
-            )
-            session.add(job)
-            await session.commit()
+        db_session.add(UpdateJob(
+            id="test-pending-456",
+            status="pending",
+            bundle_version="1.3.0",
+            from_version="1.0.0",
+            progress_pct=0,
+        ))
+        await db_session.commit()
 
         response = await admin_client.get("/vault/updates/progress/test-pending-456")
         assert response.status_code == 200
@@ -364,15 +319,6 @@ class TestRollback:
         data = response.json()
         assert data["error"]["code"] == "no_rollback_available"
 
-    @pytest.mark.asyncio
-    async def test_rollback_requires_admin(self, user_client):
-        """User-scoped key gets 403 on rollback endpoint."""
-        response = await user_client.post(
-            "/vault/updates/rollback",
-            json={"confirmation": "ROLLBACK UPDATE"},
-        )
-        assert response.status_code == 403
-
     @pytest.mark.asyncio
     async def test_rollback_returns_202_with_rollback_data(
         self, admin_client, updates_app
@@ -381,7 +327,7 @@ class TestRollback:
         # Create rollback data (version.json in the rollback directory)
         directory = updates_app.state.update_service._directory
         version_file = directory.rollback / "version.json"
-        version_file.write_text(json.dumps({"version": "1.0.0"}))
+        version_file.write_text('{"version": "1.0.0"}')
 
         response = await admin_client.post(
             "/vault/updates/rollback",
@@ -393,6 +339,19 @@ class TestRollback:
         assert data["status"] == "rollback_started"
         assert data["rollback_to_version"] == "1.0.0"
 
+    @pytest.mark.asyncio
+    async def test_rollback_keeps_empty_recorded_version(self, admin_client, updates_app):
+        """An explicitly empty version in version.json is passed through, not 'unknown'."""
+        directory = updates_app.state.update_service._directory
+        (directory.rollback / "version.json").write_text('{"version": ""}')
+
+        response = await admin_client.post(
+            "/vault/updates/rollback",
+            json={"confirmation": "ROLLBACK UPDATE"},
+        )
+        assert response.status_code == 202
+        assert response.json()["rollback_to_version"] == ""
+
     @pytest.mark.asyncio
     async def test_rollback_missing_confirmation_field(self, admin_client):
         """POST /vault/updates/rollback without confirmation field returns 422."""
@@ -419,22 +378,19 @@ class TestHistory:
         assert data["limit"] == 20
 
     @pytest.mark.asyncio
-    async def test_history_returns_jobs(self, admin_client, db_engine):
+    async def test_history_returns_jobs(self, admin_client, db_session):
         """GET /vault/updates/history returns existing update jobs."""
-        session_factory = async_sessionmaker(
-            db_engine, class_=AsyncSession, expire_on_commit=False
-        )
-        async with session_factory() as session:
-            for i in range(3):
-                job = UpdateJob(
-                    id=f"history-job-{i}",
-                    status="completed",
-                    bundle_version=f"1.{i}.0",
-                    from_version="1.0.0",
-                    progress_pct=100,
-                )
-                session.add(job)
-            await session.commit()
+        db_session.add_all([
+            UpdateJob(
+                id=f"history-job-{i}",
+                status="completed",
+                bundle_version=f"1.{i}.0",
+                from_version="1.0.0",
+                progress_pct=100,
+            )
+            for i in range(3)
+        ])
+        await db_session.commit()
 
         response = await admin_client.get("/vault/updates/history")
         assert response.status_code == 200
@@ -449,22 +405,19 @@ class TestHistory:
             assert "from_version" in item
 
     @pytest.mark.asyncio
-    async def test_history_pagination(self, admin_client, db_engine):
+    async def test_history_pagination(self, admin_client, db_session):
         """GET /vault/updates/history respects offset and limit params."""
-        session_factory = async_sessionmaker(
-            db_engine, class_=AsyncSession, expire_on_commit=False
-        )
-        async with session_factory() as session:
-            for i in range(5):
-                job = UpdateJob(
-                    id=f"page-job-{i}",
-                    status="completed",
-                    bundle_version=f"2.{i}.0",
-                    from_version="1.0.0",
-                    progress_pct=100,
-                )
-                session.add(job)
-            await session.commit()
+        db_session.add_all([
+            UpdateJob(
+                id=f"page-job-{i}",
+                status="completed",
+                bundle_version=f"2.{i}.0",
+                from_version="1.0.0",
+                progress_pct=100,
+            )
+            for i in range(5)
+        ])
+        await db_session.commit()
 
         # First page: limit=2
         response = await admin_client.get(
@@ -496,35 +449,41 @@ class TestHistory:
         assert data["total"] == 5
         assert len(data["updates"]) == 1
 
-    @pytest.mark.asyncio
-    async def test_history_requires_admin(self, user_client):
-        """User-scoped key gets 403 on history endpoint."""
-        response = await user_client.get("/vault/updates/history")
-        assert response.status_code == 403
 
+# ── Auth enforcement ─────────────────────────────────────────────────────────
 
-# ── TestAuthEnforcement ──────────────────────────────────────────────────────
+# (method, path, body) for every update route; POST bodies are valid so the
+# 401/403 comes from auth, not request validation.
+ALL_ENDPOINTS = [
+    ("GET", "/vault/updates/status", None),
+    ("POST", "/vault/updates/scan", None),
+    ("GET", "/vault/updates/pending", None),
+    ("POST", "/vault/updates/apply", {"confirmation": "APPLY UPDATE"}),
+    ("GET", "/vault/updates/progress/any-job-id", None),
+    ("POST", "/vault/updates/rollback", {"confirmation": "ROLLBACK UPDATE"}),
+    ("GET", "/vault/updates/history", None),
+]
 
 
-class TestAuthEnforcement:
-    ALL_ENDPOINTS = [
-        ("GET", "/vault/updates/status"),
-        ("POST", "/vault/updates/scan"),
-        ("GET", "/vault/updates/pending"),
-        ("POST", "/vault/updates/apply"),
-        ("GET", "/vault/updates/progress/any-job-id"),
-        ("POST", "/vault/updates/rollback"),
-        ("GET", "/vault/updates/history"),
-    ]
+class TestAdminEnforcement:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,path,body", ALL_ENDPOINTS)
+    async def test_endpoint_requires_admin(self, user_client, method, path, body):
+        """User-scoped key gets 403 on every update endpoint."""
+        response = await user_client.request(method, path, json=body)
+        assert response.status_code == 403, (
+            f"{method} {path} returned {response.status_code}, expected 403"
+        )
 
+
+class TestAuthEnforcement:
     @pytest.mark.asyncio
-    async def test_all_endpoints_reject_unauthenticated(self, anon_updates_client):
-        """All 7 update endpoints return 401 for unauthenticated requests."""
-        for method, path in self.ALL_ENDPOINTS:
-            if method == "GET":
-                response = await anon_updates_client.get(path)
-            else:
-                response = await anon_updates_client.post(path, json={})
-            assert response.status_code == 401, (
-                f"{method} {path} returned {response.status_code}, expected 401"
-            )
+    @pytest.mark.parametrize("method,path,body", ALL_ENDPOINTS)
+    async def test_endpoint_rejects_unauthenticated(
+        self, anon_updates_client, method, path, body
+    ):
+        """Unauthenticated requests get 401 on every update endpoint."""
+        response = await anon_updates_client.request(method, path, json=body)
+        assert response.status_code == 401, (
+            f"{method} {path} returned {response.status_code}, expected 401"
+        )
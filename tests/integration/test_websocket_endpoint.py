@@ -1,80 +1,100 @@
 import pytest
 import pytest_asyncio
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.testclient import TestClient
 
 from app.core.database import ApiKey
 from app.core.security import generate_api_key, get_key_prefix, hash_api_key
 
+# Each test gets a fresh database, so the raw keys and their rows can be
+# built once; fixtures only hold a connection for the INSERT + COMMIT.
+_WS_USER_KEY = generate_api_key()
+_WS_ADMIN_KEY = generate_api_key()
+_WS_KEY_ROWS = [
+    {
+        "key_hash": hash_api_key(_WS_USER_KEY),
+        "key_prefix": get_key_prefix(_WS_USER_KEY),
+        "label": "ws-test",
+        "scope": "user",
+        "is_active": True,
+    },
+    {
+        "key_hash": hash_api_key(_WS_ADMIN_KEY),
+        "key_prefix": get_key_prefix(_WS_ADMIN_KEY),
+        "label": "ws-admin-test",
+        "scope": "admin",
+        "is_active": True,
+    },
+]
+
 
 @pytest_asyncio.fixture
 async def ws_app(app_with_db):
     """Register WebSocket router on the test app."""
     from app.api.v1.websocket import router as ws_router
 
-    app_with_db.include_router(ws_router, tags=["WebSocket"])
+    # Only add if not already registered — app_with_db is the shared app
+    # singleton, so an unconditional include grows its route table per test.
+    existing = {r.path for r in app_with_db.routes}
+    if "/ws/system" not in existing:
+        app_with_db.include_router(ws_router, tags=["WebSocket"])
     yield app_with_db
 
 
 @pytest_asyncio.fixture
-async def ws_api_key(ws_app, db_engine):
-    """Create an API key for WebSocket auth and return the raw key."""
+async def ws_keys(ws_app, db_engine):
+    """Insert user- and admin-scope WebSocket keys; return (user_key, admin_key)."""
     session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
-    raw_key = generate_api_key()
     async with session_factory() as session:
-        key_row = ApiKey(
-            key_hash=hash_api_key(raw_key),
-            key_prefix=get_key_prefix(raw_key),
-            label="ws-test",
-            scope="user",
-            is_active=True,
-        )
-        session.add(key_row)
+        await session.execute(insert(ApiKey), _WS_KEY_ROWS)
         await session.commit()
-    return raw_key
+    return _WS_USER_KEY, _WS_ADMIN_KEY
 
 
-@pytest_asyncio.fixture
-async def ws_admin_key(ws_app, db_engine):
-    """Create an admin-scope API key for WebSocket auth and return the raw key."""
-    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
-    raw_key = generate_api_key()
-    async with session_factory() as session:
-        key_row = ApiKey(
-            key_hash=hash_api_key(raw_key),
-            key_prefix=get_key_prefix(raw_key),
-            label="ws-admin-test",
-            scope="admin",
-            is_active=True,
-        )
-        session.add(key_row)
-        await session.commit()
-    return raw_key
+@pytest.fixture
+def ws_client(ws_app):
+    """Sync TestClient for the WebSocket app.
+
+    Not entered as a context manager: that would run app.main's lifespan
+    (init_db against the configured database). Each websocket_connect
+    opens its own portal either way, so the client is cheap to build.
+    """
+    return TestClient(ws_app)
+
+
+@pytest.fixture
+def ws_api_key(ws_keys):
+    """Raw user-scope API key for WebSocket auth."""
+    return ws_keys[0]
+
+
+@pytest.fixture
+def ws_admin_key(ws_keys):
+    """Raw admin-scope API key for WebSocket auth."""
+    return ws_keys[1]
 
 
 class TestWebSocketSystem:
     @pytest.mark.asyncio
-    async def test_invalid_token_rejected(self, ws_app):
+    async def test_invalid_token_rejected(self, ws_client):
         """WebSocket connection with an invalid token should be closed."""
-        client = TestClient(ws_app)
         with pytest.raises(Exception):
             # Invalid token should cause WebSocket close with code 4001
-            with client.websocket_connect("/ws/system?token=invalid"):
+            with ws_client.websocket_connect("/ws/system?token=invalid"):
                 pass
 
     @pytest.mark.asyncio
-    async def test_missing_token_rejected(self, ws_app):
+    async def test_missing_token_rejected(self, ws_client):
         """WebSocket connection without a token should be closed."""
-        client = TestClient(ws_app)
         with pytest.raises(Exception):
-            with client.websocket_connect("/ws/system"):
+            with ws_client.websocket_connect("/ws/system"):
                 pass
 
     @pytest.mark.asyncio
-    async def test_valid_token_receives_metrics(self, ws_app, ws_api_key):
+    async def test_valid_token_receives_metrics(self, ws_client, ws_api_key):
         """WebSocket connection with a valid token should receive metrics."""
-        client = TestClient(ws_app)
-        with client.websocket_connect(f"/ws/system?token={ws_api_key}") as ws:
+        with ws_client.websocket_connect(f"/ws/system?token={ws_api_key}") as ws:
             data = ws.receive_json()
             assert "timestamp" in data
             assert "resources" in data
@@ -91,53 +111,48 @@ class TestWebSocketSystem:
 
 class TestWebSocketLogs:
     @pytest.mark.asyncio
-    async def test_invalid_token_rejected(self, ws_app):
+    async def test_invalid_token_rejected(self, ws_client):
         """WebSocket /ws/logs with invalid token should close with 4001."""
-        client = TestClient(ws_app)
         with pytest.raises(Exception):
-            with client.websocket_connect("/ws/logs?token=invalid"):
+            with ws_client.websocket_connect("/ws/logs?token=invalid"):
                 pass
 
     @pytest.mark.asyncio
-    async def test_missing_token_rejected(self, ws_app):
+    async def test_missing_token_rejected(self, ws_client):
         """WebSocket /ws/logs without a token should close with 4001."""
-        client = TestClient(ws_app)
         with pytest.raises(Exception):
-            with client.websocket_connect("/ws/logs"):
+            with ws_client.websocket_connect("/ws/logs"):
                 pass
 
     @pytest.mark.asyncio
-    async def test_user_scope_rejected(self, ws_app, ws_api_key):
+    async def test_user_scope_rejected(self, ws_client, ws_api_key):
         """WebSocket /ws/logs with user-scope token should close with 4003."""
-        client = TestClient(ws_app)
         with pytest.raises(Exception):
-            with client.websocket_connect(f"/ws/logs?token={ws_api_key}"):
+            with ws_client.websocket_connect(f"/ws/logs?token={ws_api_key}"):
                 pass
 
     @pytest.mark.asyncio
-    async def test_admin_non_linux_receives_info(self, ws_app, ws_admin_key):
+    async def test_admin_non_linux_receives_info(self, ws_client, ws_admin_key):
         """On non-Linux, admin should receive an info message."""
         import platform
 
         if platform.system() == "Linux":
             pytest.skip("Test is for non-Linux platforms")
 
-        client = TestClient(ws_app)
-        with client.websocket_connect(f"/ws/logs?token={ws_admin_key}") as ws:
+        with ws_client.websocket_connect(f"/ws/logs?token={ws_admin_key}") as ws:
             data = ws.receive_json()
             assert data["type"] == "info"
             assert "unavailable" in data["message"].lower() or "not running" in data["message"].lower()
 
     @pytest.mark.asyncio
-    async def test_admin_non_linux_no_crash(self, ws_app, ws_admin_key):
+    async def test_admin_non_linux_no_crash(self, ws_client, ws_admin_key):
         """On non-Linux, connection should complete without crashing."""
         import platform
 
         if platform.system() == "Linux":
             pytest.skip("Test is for non-Linux platforms")
 
-        client = TestClient(ws_app)
         # Should not raise — connection accepted, info sent, then closed cleanly
-        with client.websocket_connect(f"/ws/logs?token={ws_admin_key}") as ws:
+        with ws_client.websocket_connect(f"/ws/logs?token={ws_admin_key}") as ws:
             data = ws.receive_json()
             assert data is not None
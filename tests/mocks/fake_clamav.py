@@ -1,5 +1,7 @@
 """Fake ClamAV client for testing — detects EICAR test string, reports clean otherwise."""
 
+import mmap
+import os
 from pathlib import Path
 
 # Standard EICAR test signature
@@ -18,12 +20,19 @@ class FakeClamAVClient:
     def scan_file(self, file_path: Path) -> dict:
         if not self._available:
             return {"status": "unavailable", "message": "ClamAV daemon not running (mock)"}
-        data = file_path.read_bytes()
-        return self.scan_bytes(data)
+        # Search the file through a read-only mapping instead of copying it
+        # into memory; mmap rejects empty files, which are clean anyway.
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < len(EICAR_SIGNATURE):
+                return {"status": "clean"}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(EICAR_SIGNATURE) >= 0:
+                    return {"status": "infected", "threat": "Win.Test.EICAR_HDB-1"}
+        return {"status": "clean"}
 
     def scan_bytes(self, data: bytes) -> dict:
         if not self._available:
             return {"status": "unavailable", "message": "ClamAV daemon not running (mock)"}
-        if EICAR_SIGNATURE in data:
+        if len(data) >= len(EICAR_SIGNATURE) and EICAR_SIGNATURE in data:
             return {"status": "infected", "threat": "Win.Test.EICAR_HDB-1"}
         return {"status": "clean"}
@@ -1,3 +1,7 @@
+class NotFound(Exception):
+    """Stand-in for docker.errors.NotFound."""
+
+
 class FakeContainer:
     def __init__(self, name, status="running"):
         self.name = name
@@ -12,9 +16,10 @@ class FakeContainerCollection:
         self._containers = {"vault-vllm": FakeContainer("vault-vllm")}
 
     def get(self, name):
-        if name in self._containers:
+        try:
             return self._containers[name]
-        raise Exception(f"Container {name} not found")
+        except KeyError:
+            raise NotFound(f"Container {name} not found") from None
 
 
 class FakeDockerClient:
@@ -8,7 +8,7 @@ import time
 import uuid
 
 from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 app = FastAPI(title="Fake vLLM")
@@ -16,6 +16,64 @@ app = FastAPI(title="Fake vLLM")
 STREAM_TOKENS = ["Hello", " from", " Vault", " AI", "!"]
 
 
+# ── Pre-serialized responses ────────────────────────────────────────────────
+# Constant bodies are serialized once at import. Stream chunks only differ
+# per request in id/created/model, so each frame is serialized with string
+# placeholders and the JSON-encoded values are spliced in per request.
+
+_ID = b'"__ID__"'
+_CREATED = b'"__CREATED__"'
+_MODEL = b'"__MODEL__"'
+
+
+def _sse_template(obj: str, choice: dict) -> bytes:
+    chunk = {
+        "id": "__ID__",
+        "object": obj,
+        "created": "__CREATED__",
+        "model": "__MODEL__",
+        "choices": [choice],
+    }
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+def _json_body(content) -> bytes:
+    """Serialize a constant response body the way JSONResponse would."""
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _fill(template: bytes, chunk_id: bytes, created: bytes, model: bytes) -> bytes:
+    """Splice JSON-encoded per-request values into a pre-serialized frame."""
+    return template.replace(_ID, chunk_id).replace(_CREATED, created).replace(_MODEL, model)
+
+
+_CHAT_CHUNK_TEMPLATES = [
+    _sse_template(
+        "chat.completion.chunk",
+        {
+            "index": 0,
+            "delta": {"content": token} if i > 0 else {"role": "assistant", "content": token},
+            "finish_reason": None,
+        },
+    )
+    for i, token in enumerate(STREAM_TOKENS)
+]
+
+_CHAT_FINAL_TEMPLATE = _sse_template(
+    "chat.completion.chunk", {"index": 0, "delta": {}, "finish_reason": "stop"}
+)
+
+_TEXT_CHUNK_TEMPLATES = [
+    _sse_template("text_completion", {"index": 0, "text": token, "finish_reason": None})
+    for token in STREAM_TOKENS
+]
+_TEXT_FINAL_TEMPLATE = _sse_template(
+    "text_completion", {"index": 0, "text": "", "finish_reason": "stop"}
+)
+
+_DONE = b"data: [DONE]\n\n"
+
+
 class _ChatMessage(BaseModel):
     role: str
     content: str
@@ -38,38 +96,14 @@ async def chat_completions(request: _ChatRequest):
 
     if request.stream:
         async def generate():
-            for i, token in enumerate(STREAM_TOKENS):
-                chunk = {
-                    "id": chat_id,
-                    "object": "chat.completion.chunk",
-                    "created": created,
-                    "model": request.model,
-                    "choices": [
-                        {
-                            "index": 0,
-                            "delta": {"content": token} if i > 0 else {"role": "assistant", "content": token},
-                            "finish_reason": None,
-                        }
-                    ],
-                }
-                yield f"data: {json.dumps(chunk)}\n\n"
-
+            id_b = json.dumps(chat_id).encode()
+            created_b = str(created).encode()
+            model_b = json.dumps(request.model).encode()
+            for template in _CHAT_CHUNK_TEMPLATES:
+                yield _fill(template, id_b, created_b, model_b)
             # Final chunk with finish_reason
-            final_chunk = {
-                "id": chat_id,
-                "object": "chat.completion.chunk",
-                "created": created,
-                "model": request.model,
-                "choices": [
-                    {
-                        "index": 0,
-                        "delta": {},
-                        "finish_reason": "stop",
-                    }
-                ],
-            }
-            yield f"data: {json.dumps(final_chunk)}\n\n"
-            yield "data: [DONE]\n\n"
+            yield _fill(_CHAT_FINAL_TEMPLATE, id_b, created_b, model_b)
+            yield _DONE
 
         return StreamingResponse(generate(), media_type="text/event-stream")
 
@@ -115,24 +149,13 @@ async def text_completions(request: _CompletionRequest):
 
     if request.stream:
         async def generate():
-            for token in STREAM_TOKENS:
-                chunk = {
-                    "id": comp_id,
-                    "object": "text_completion",
-                    "created": created,
-                    "model": request.model,
-                    "choices": [{"index": 0, "text": token, "finish_reason": None}],
-                }
-                yield f"data: {json.dumps(chunk)}\n\n"
-            final = {
-                "id": comp_id,
-                "object": "text_completion",
-                "created": created,
-                "model": request.model,
-                "choices": [{"index": 0, "text": "", "finish_reason": "stop"}],
-            }
-            yield f"data: {json.dumps(final)}\n\n"
-            yield "data: [DONE]\n\n"
+            id_b = json.dumps(comp_id).encode()
+            created_b = str(created).encode()
+            model_b = json.dumps(request.model).encode()
+            for template in _TEXT_CHUNK_TEMPLATES:
+                yield _fill(template, id_b, created_b, model_b)
+            yield _fill(_TEXT_FINAL_TEMPLATE, id_b, created_b, model_b)
+            yield _DONE
 
         return StreamingResponse(generate(), media_type="text/event-stream")
 
@@ -152,65 +175,79 @@ class _EmbeddingRequest(BaseModel):
     encoding_format: str = "float"
 
 
+# Shared by every embedding in every response; json.dumps encodes tuples as arrays.
+_EMBED_VECTOR = (0.1,) * 384
+
+
 @app.post("/v1/embeddings")
 async def create_embeddings(request: _EmbeddingRequest):
     inputs = [request.input] if isinstance(request.input, str) else request.input
     data = [
-        {"object": "embedding", "embedding": [0.1] * 384, "index": i}
+        {"object": "embedding", "embedding": _EMBED_VECTOR, "index": i}
         for i in range(len(inputs))
     ]
-    return {
-        "object": "list",
-        "data": data,
-        "model": request.model,
-        "usage": {"prompt_tokens": len(inputs) * 5, "total_tokens": len(inputs) * 5},
-    }
+    # Encode directly: FastAPI's jsonable_encoder would walk all 384 floats per input.
+    return Response(
+        _json_body({
+            "object": "list",
+            "data": data,
+            "model": request.model,
+            "usage": {"prompt_tokens": len(inputs) * 5, "total_tokens": len(inputs) * 5},
+        }),
+        media_type="application/json",
+    )
+
+
+_MODELS_BODY = _json_body({
+    "object": "list",
+    "data": [
+        {"id": "qwen2.5-32b-awq", "object": "model", "owned_by": "vault"},
+    ],
+})
 
 
 @app.get("/v1/models")
 async def list_models():
-    return {
-        "object": "list",
-        "data": [
-            {"id": "qwen2.5-32b-awq", "object": "model", "owned_by": "vault"},
-        ],
-    }
+    return Response(_MODELS_BODY, media_type="application/json")
 
 
 # ── Ollama-compatible endpoints (for dev parity) ────────────────────────────
 
 
+_TAGS_BODY = _json_body({
+    "models": [
+        {
+            "name": "qwen2.5-32b-awq:latest",
+            "model": "qwen2.5-32b-awq:latest",
+            "size": 21474836480,
+            "digest": "abc123def456",
+            "details": {
+                "family": "qwen2",
+                "parameter_size": "32.5B",
+                "quantization_level": "Q4_0",
+                "format": "gguf",
+            },
+        },
+        {
+            "name": "nomic-embed-text:latest",
+            "model": "nomic-embed-text:latest",
+            "size": 274302450,
+            "digest": "def789abc012",
+            "details": {
+                "family": "nomic-bert",
+                "parameter_size": "137M",
+                "quantization_level": "F16",
+                "format": "gguf",
+            },
+        },
+    ]
+})
+
+
 @app.get("/api/tags")
 async def ollama_tags():
     """Ollama /api/tags — rich model metadata."""
-    return {
-        "models": [
-            {
-                "name": "qwen2.5-32b-awq:latest",
-                "model": "qwen2.5-32b-awq:latest",
-                "size": 21474836480,
-                "digest": "abc123def456",
-                "details": {
-                    "family": "qwen2",
-                    "parameter_size": "32.5B",
-                    "quantization_level": "Q4_0",
-                    "format": "gguf",
-                },
-            },
-            {
-                "name": "nomic-embed-text:latest",
-                "model": "nomic-embed-text:latest",
-                "size": 274302450,
-                "digest": "def789abc012",
-                "details": {
-                    "family": "nomic-bert",
-                    "parameter_size": "137M",
-                    "quantization_level": "F16",
-                    "format": "gguf",
-                },
-            },
-        ]
-    }
+    return Response(_TAGS_BODY, media_type="application/json")
 
 
 class _ShowRequest(BaseModel):
@@ -245,28 +282,33 @@ _SHOW_DATA = {
 }
 
 
+_SHOW_BODIES = {name: _json_body(data) for name, data in _SHOW_DATA.items()}
+
+
 @app.post("/api/show")
 async def ollama_show(request: _ShowRequest):
     """Ollama /api/show — detailed model info including context length."""
-    data = _SHOW_DATA.get(request.name)
-    if data is None:
-        from fastapi.responses import JSONResponse
+    body = _SHOW_BODIES.get(request.name)
+    if body is None:
         return JSONResponse(status_code=404, content={"error": f"model '{request.name}' not found"})
-    return data
+    return Response(body, media_type="application/json")
+
+
+_PS_BODY = _json_body({
+    "models": [
+        {
+            "name": "qwen2.5-32b-awq:latest",
+            "model": "qwen2.5-32b-awq:latest",
+            "size": 21474836480,
+        }
+    ]
+})
 
 
 @app.get("/api/ps")
 async def ollama_ps():
     """Ollama /api/ps — currently loaded/running models."""
-    return {
-        "models": [
-            {
-                "name": "qwen2.5-32b-awq:latest",
-                "model": "qwen2.5-32b-awq:latest",
-                "size": 21474836480,
-            }
-        ]
-    }
+    return Response(_PS_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -1,51 +1,84 @@
 """Unit tests for AdapterManager — adapter CRUD with mock Docker."""
 
-import json
-from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import select
 
-from app.core.database import Adapter, Base
+from app.core.database import Adapter
 from app.core.exceptions import NotFoundError, VaultError
 from app.services.training.adapter_manager import AdapterManager
 
 
-@pytest_asyncio.fixture
-async def adapter_db():
-    """In-memory SQLite engine with adapter table."""
-    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    yield session_factory
-    await engine.dispose()
+@pytest.fixture
+def adapter_db(rollback_session_factory):
+    """Session factory over the shared engine, rolled back after each test."""
+    return rollback_session_factory
 
 
-@pytest.fixture
-def adapter_dir(tmp_path):
-    """Create a mock adapter directory on disk."""
-    adapter_path = tmp_path / "test-adapter"
+@pytest.fixture(scope="session")
+def adapter_dir(tmp_path_factory):
+    """Create a mock adapter directory on disk (read-only, shared)."""
+    adapter_path = tmp_path_factory.mktemp("adapters") / "test-adapter"
     adapter_path.mkdir()
-    (adapter_path / "adapter_config.json").write_text('{"r": 16}')
+    (adapter_path / "adapter_config.json").write_bytes(b'{"r": 16}')
     (adapter_path / "adapter_model.safetensors").write_bytes(b"fake-weights" * 100)
     return adapter_path
 
 
+class _StubModelManager:
+    """Stands in for ModelManager's gpu-config load/save during (de)activation."""
+
+    def __init__(self):
+        self.config = {"strategy": "replica", "models": [], "lora_modules": []}
+        self.saved = []
+
+    def _load_gpu_config(self):
+        return self.config
+
+    def _save_gpu_config(self, config):
+        self.config = config
+        self.saved.append(config)
+
+
 @pytest.fixture
 def manager(adapter_db):
     return AdapterManager(session_factory=adapter_db)
 
 
+@pytest_asyncio.fixture
+async def seeded_adapter(manager, adapter_dir):
+    """A registered, ready adapter backed by the shared adapter_dir."""
+    return await manager.register_adapter(
+        name="test-adapter",
+        base_model="model-1",
+        adapter_type="lora",
+        path=str(adapter_dir),
+    )
+
+
+@pytest_asyncio.fixture
+async def disposable_adapter(manager, tmp_path):
+    """A registered adapter with its own directory, for tests that delete it."""
+    adapter_path = tmp_path / "disposable"
+    adapter_path.mkdir()
+    (adapter_path / "model.safetensors").write_bytes(b"data")
+    info = await manager.register_adapter(
+        name="to-delete",
+        base_model="model-1",
+        adapter_type="lora",
+        path=str(adapter_path),
+    )
+    return info, adapter_path
+
+
 class TestAdapterManager:
-    @pytest.mark.asyncio
     async def test_list_empty(self, manager):
         result = await manager.list_adapters()
         assert result.total == 0
         assert result.adapters == []
 
-    @pytest.mark.asyncio
     async def test_register_adapter(self, manager, adapter_dir):
         info = await manager.register_adapter(
             name="legal-lora",
@@ -63,24 +96,15 @@ class TestAdapterManager:
         assert info.size_bytes > 0
         assert info.training_job_id == "job-123"
 
-    @pytest.mark.asyncio
-    async def test_get_adapter(self, manager, adapter_dir):
-        created = await manager.register_adapter(
-            name="test-adapter",
-            base_model="model-1",
-            adapter_type="lora",
-            path=str(adapter_dir),
-        )
-        fetched = await manager.get_adapter(created.id)
-        assert fetched.id == created.id
+    async def test_get_adapter(self, manager, seeded_adapter):
+        fetched = await manager.get_adapter(seeded_adapter.id)
+        assert fetched.id == seeded_adapter.id
         assert fetched.name == "test-adapter"
 
-    @pytest.mark.asyncio
     async def test_get_adapter_not_found(self, manager):
         with pytest.raises(NotFoundError):
             await manager.get_adapter("nonexistent-id")
 
-    @pytest.mark.asyncio
     async def test_list_after_register(self, manager, adapter_dir):
         await manager.register_adapter(
             name="adapter-1",
@@ -97,19 +121,8 @@ class TestAdapterManager:
         result = await manager.list_adapters()
         assert result.total == 2
 
-    @pytest.mark.asyncio
-    async def test_delete_adapter(self, manager, tmp_path):
-        # Create a disposable adapter dir
-        adapter_path = tmp_path / "disposable"
-        adapter_path.mkdir()
-        (adapter_path / "model.safetensors").write_bytes(b"data")
-
-        info = await manager.register_adapter(
-            name="to-delete",
-            base_model="model-1",
-            adapter_type="lora",
-            path=str(adapter_path),
-        )
+    async def test_delete_adapter(self, manager, disposable_adapter):
+        info, adapter_path = disposable_adapter
 
         await manager.delete_adapter(info.id)
 
@@ -120,77 +133,41 @@ class TestAdapterManager:
         with pytest.raises(NotFoundError):
             await manager.get_adapter(info.id)
 
-    @pytest.mark.asyncio
-    async def test_delete_active_adapter_rejected(self, manager, adapter_db, adapter_dir):
+    async def test_delete_active_adapter_rejected(self, manager, adapter_db, seeded_adapter):
         """Cannot delete an active adapter."""
-        info = await manager.register_adapter(
-            name="active-adapter",
-            base_model="model-1",
-            adapter_type="lora",
-            path=str(adapter_dir),
-        )
-
         # Manually set status to active in DB
         async with adapter_db() as session:
-            from sqlalchemy import select
-            result = await session.execute(select(Adapter).where(Adapter.id == info.id))
+            result = await session.execute(select(Adapter).where(Adapter.id == seeded_adapter.id))
             row = result.scalar_one()
             row.status = "active"
             await session.commit()
 
         with pytest.raises(VaultError) as exc_info:
-            await manager.delete_adapter(info.id)
+            await manager.delete_adapter(seeded_adapter.id)
         assert exc_info.value.status == 409
         assert "active" in exc_info.value.message.lower()
 
-    @pytest.mark.asyncio
-    async def test_activate_adapter(self, manager, adapter_db, adapter_dir, tmp_path):
+    async def test_activate_adapter(self, manager, seeded_adapter):
         """Activating should update gpu-config and set status to active."""
-        from unittest.mock import patch, MagicMock
-
-        info = await manager.register_adapter(
-            name="to-activate",
-            base_model="model-1",
-            adapter_type="lora",
-            path=str(adapter_dir),
-        )
-
-        mock_manager = MagicMock()
-        mock_manager._load_gpu_config.return_value = {"strategy": "replica", "models": []}
-        mock_manager._save_gpu_config = MagicMock()
-
-        with patch("app.services.model_manager.ModelManager", return_value=mock_manager):
-            result = await manager.activate_adapter(info.id)
+        stub = _StubModelManager()
+        with patch("app.services.model_manager.ModelManager", lambda: stub):
+            result = await manager.activate_adapter(seeded_adapter.id)
 
         assert result.status == "active"
         assert result.activated_at is not None
-        mock_manager._save_gpu_config.assert_called_once()
+        assert len(stub.saved) == 1
 
-    @pytest.mark.asyncio
-    async def test_deactivate_adapter(self, manager, adapter_db, adapter_dir):
+    async def test_deactivate_adapter(self, manager, seeded_adapter):
         """Deactivating should remove from gpu-config and set status to ready."""
-        from unittest.mock import patch, MagicMock
-
-        info = await manager.register_adapter(
-            name="to-deactivate",
-            base_model="model-1",
-            adapter_type="lora",
-            path=str(adapter_dir),
-        )
-
         # First activate
-        mock_manager = MagicMock()
-        mock_manager._load_gpu_config.return_value = {"strategy": "replica", "models": [], "lora_modules": []}
-        mock_manager._save_gpu_config = MagicMock()
-
-        with patch("app.services.model_manager.ModelManager", return_value=mock_manager):
-            await manager.activate_adapter(info.id)
-            result = await manager.deactivate_adapter(info.id)
+        stub = _StubModelManager()
+        with patch("app.services.model_manager.ModelManager", lambda: stub):
+            await manager.activate_adapter(seeded_adapter.id)
+            result = await manager.deactivate_adapter(seeded_adapter.id)
 
         assert result.status == "ready"
         assert result.activated_at is None
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent(self, manager):
         with pytest.raises(NotFoundError):
             await manager.delete_adapter("fake-id")
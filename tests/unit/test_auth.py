@@ -1,19 +1,30 @@
 import pytest
-import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.services.auth import AuthService
 from app.core.database import ApiKey
-from app.core.security import hash_api_key
+from app.core.security import generate_api_key, get_key_prefix, hash_api_key
 
 
-@pytest_asyncio.fixture
-async def auth_service(db_engine):
-    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
-    return AuthService(session_factory=session_factory)
+@pytest.fixture
+def auth_service(rollback_session_factory):
+    return AuthService(session_factory=rollback_session_factory)
+
+
+async def _seed_revoked_key(session_factory, label: str) -> ApiKey:
+    """Insert an already-revoked key in one commit, skipping the create/revoke round trip."""
+    raw_key = generate_api_key()
+    key_row = ApiKey(
+        key_hash=hash_api_key(raw_key),
+        key_prefix=get_key_prefix(raw_key),
+        label=label,
+        is_active=False,
+    )
+    async with session_factory() as session:
+        session.add(key_row)
+        await session.commit()
+    return key_row
 
 
-@pytest.mark.asyncio
 async def test_create_key_returns_raw_key_and_row(auth_service):
     raw_key, key_row = await auth_service.create_key(label="test-key")
     assert raw_key.startswith("vault_sk_")
@@ -24,14 +35,12 @@ async def test_create_key_returns_raw_key_and_row(auth_service):
     assert key_row.id is not None
 
 
-@pytest.mark.asyncio
 async def test_create_key_admin_scope(auth_service):
     raw_key, key_row = await auth_service.create_key(label="admin-key", scope="admin")
     assert key_row.scope == "admin"
     assert key_row.label == "admin-key"
 
 
-@pytest.mark.asyncio
 async def test_list_keys_returns_created_keys(auth_service):
     await auth_service.create_key(label="key-a")
     await auth_service.create_key(label="key-b")
@@ -41,16 +50,13 @@ async def test_list_keys_returns_created_keys(auth_service):
     assert "key-b" in labels
 
 
-@pytest.mark.asyncio
-async def test_list_keys_excludes_revoked(auth_service):
-    raw_key, key_row = await auth_service.create_key(label="will-revoke")
-    await auth_service.revoke_key(key_row.key_prefix)
+async def test_list_keys_excludes_revoked(auth_service, rollback_session_factory):
+    await _seed_revoked_key(rollback_session_factory, "will-revoke")
     keys = await auth_service.list_keys()
     labels = [k.label for k in keys]
     assert "will-revoke" not in labels
 
 
-@pytest.mark.asyncio
 async def test_revoke_key_by_prefix(auth_service):
     raw_key, key_row = await auth_service.create_key(label="prefix-revoke")
     result = await auth_service.revoke_key(key_row.key_prefix)
@@ -58,9 +64,10 @@ async def test_revoke_key_by_prefix(auth_service):
     # Verify the key is no longer valid
     validated = await auth_service.validate_key(raw_key)
     assert validated is None
+    # ...and no longer listed
+    assert key_row.label not in {k.label for k in await auth_service.list_keys()}
 
 
-@pytest.mark.asyncio
 async def test_revoke_key_by_full_key(auth_service):
     raw_key, key_row = await auth_service.create_key(label="full-revoke")
     result = await auth_service.revoke_key(raw_key)
@@ -69,13 +76,11 @@ async def test_revoke_key_by_full_key(auth_service):
     assert validated is None
 
 
-@pytest.mark.asyncio
 async def test_revoke_unknown_key_returns_false(auth_service):
     result = await auth_service.revoke_key("vault_sk_xx")
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_validate_key_valid(auth_service):
     raw_key, key_row = await auth_service.create_key(label="valid-key")
     validated = await auth_service.validate_key(raw_key)
@@ -84,7 +89,6 @@ async def test_validate_key_valid(auth_service):
     assert validated.is_active is True
 
 
-@pytest.mark.asyncio
 async def test_validate_key_invalid_returns_none(auth_service):
     result = await auth_service.validate_key("vault_sk_0000000000000000000000000000000000000000000000aa")
     assert result is None
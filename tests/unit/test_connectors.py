@@ -4,21 +4,20 @@ import json
 import os
 
 import pytest
-import pytest_asyncio
 
 from app.services.dataset.connectors import LocalConnector, get_connector
 
 
-@pytest.fixture
-def local_dir(tmp_path):
-    """Create a temporary directory with sample files."""
-    # Create sample files
-    (tmp_path / "train.jsonl").write_text('{"text": "hello"}\n{"text": "world"}\n')
-    (tmp_path / "eval.csv").write_text("prompt,response\nhello,world\nfoo,bar\n")
-    (tmp_path / "readme.txt").write_text("This is a readme.\n")
-    (tmp_path / "sub").mkdir()
-    (tmp_path / "sub" / "nested.jsonl").write_text('{"a": 1}\n')
-    return tmp_path
+@pytest.fixture(scope="session")
+def local_dir(tmp_path_factory):
+    """Create a temporary directory with sample files (read-only, shared)."""
+    root = tmp_path_factory.mktemp("local_dir")
+    (root / "train.jsonl").write_bytes(b'{"text": "hello"}\n{"text": "world"}\n')
+    (root / "eval.csv").write_bytes(b"prompt,response\nhello,world\nfoo,bar\n")
+    (root / "readme.txt").write_bytes(b"This is a readme.\n")
+    (root / "sub").mkdir()
+    (root / "sub" / "nested.jsonl").write_bytes(b'{"a": 1}\n')
+    return root
 
 
 @pytest.fixture
@@ -26,14 +25,12 @@ def connector(local_dir):
     return LocalConnector(base_path=str(local_dir))
 
 
-@pytest.mark.asyncio
 async def test_local_test_connection_success(connector):
     success, message = await connector.test_connection()
     assert success is True
     assert "Connected" in message
 
 
-@pytest.mark.asyncio
 async def test_local_test_connection_missing_path():
     conn = LocalConnector(base_path="/nonexistent/path/abc123")
     success, message = await conn.test_connection()
@@ -41,69 +38,55 @@ async def test_local_test_connection_missing_path():
     assert "does not exist" in message
 
 
-@pytest.mark.asyncio
-async def test_local_list_files_jsonl(connector, local_dir):
-    files = await connector.list_files(["*.jsonl"])
-    assert len(files) == 2  # train.jsonl + sub/nested.jsonl
-    paths = {f["relative_path"] for f in files}
-    assert "train.jsonl" in paths
-    assert os.path.join("sub", "nested.jsonl") in paths
-
-
-@pytest.mark.asyncio
-async def test_local_list_files_csv(connector):
-    files = await connector.list_files(["*.csv"])
-    assert len(files) == 1
-    assert files[0]["relative_path"] == "eval.csv"
-
-
-@pytest.mark.asyncio
-async def test_local_list_files_multiple_patterns(connector):
-    files = await connector.list_files(["*.jsonl", "*.csv", "*.txt"])
-    assert len(files) == 4  # train.jsonl, eval.csv, readme.txt, sub/nested.jsonl
-
+@pytest.mark.parametrize(
+    "patterns, expected",
+    [
+        (["*.jsonl"], {"train.jsonl", os.path.join("sub", "nested.jsonl")}),
+        (["*.csv"], {"eval.csv"}),
+        (
+            ["*.jsonl", "*.csv", "*.txt"],
+            {"train.jsonl", "eval.csv", "readme.txt", os.path.join("sub", "nested.jsonl")},
+        ),
+        (["*.parquet"], set()),
+    ],
+    ids=["jsonl", "csv", "multiple_patterns", "no_matches"],
+)
+async def test_local_list_files(connector, patterns, expected):
+    files = await connector.list_files(patterns)
+    assert len(files) == len(expected)
+    assert {f["relative_path"] for f in files} == expected
 
-@pytest.mark.asyncio
-async def test_local_list_files_no_matches(connector):
-    files = await connector.list_files(["*.parquet"])
-    assert len(files) == 0
 
-
-@pytest.mark.asyncio
 async def test_local_read_file_full(connector, local_dir):
     data = await connector.read_file(str(local_dir / "train.jsonl"))
     assert b'"text": "hello"' in data
 
 
-@pytest.mark.asyncio
 async def test_local_read_file_limited(connector, local_dir):
     data = await connector.read_file(str(local_dir / "train.jsonl"), limit=10)
     assert len(data) == 10
 
 
-@pytest.mark.asyncio
 async def test_local_read_file_relative(connector):
     data = await connector.read_file("train.jsonl")
     assert b"hello" in data
 
 
-@pytest.mark.asyncio
-async def test_local_file_info_exists(connector, local_dir):
-    info = await connector.file_info(str(local_dir / "train.jsonl"))
-    assert info["exists"] is True
-    assert info["size"] > 0
-
-
-@pytest.mark.asyncio
-async def test_local_file_info_missing(connector):
-    info = await connector.file_info("nonexistent.jsonl")
-    assert info["exists"] is False
-
-
-@pytest.mark.asyncio
-async def test_local_file_info_relative(connector):
-    info = await connector.file_info("eval.csv")
-    assert info["exists"] is True
+@pytest.mark.parametrize(
+    "name, absolute, exists",
+    [
+        ("train.jsonl", True, True),
+        ("eval.csv", False, True),
+        ("nonexistent.jsonl", False, False),
+    ],
+    ids=["exists", "relative", "missing"],
+)
+async def test_local_file_info(connector, local_dir, name, absolute, exists):
+    path = str(local_dir / name) if absolute else name
+    info = await connector.file_info(path)
+    assert info["exists"] is exists
+    if exists:
+        assert info["size"] > 0
 
 
 # ── get_connector factory ─────────────────────────────────────────────────
@@ -1,25 +1,22 @@
 """Unit tests for DatasetService (Epic 22)."""
 
-import json
-import os
+import uuid
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import insert
 
-from app.core.database import Base, Dataset
+from app.config import settings
+from app.core.database import Dataset
+from app.core.exceptions import NotFoundError
+from app.schemas.dataset import DatasetCreate, DatasetUpdate
 from app.services.dataset.dataset_service import DatasetService
 
 
-@pytest_asyncio.fixture
-async def session_factory():
-    """In-memory SQLite engine + session for unit tests."""
-    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    yield factory
-    await engine.dispose()
+@pytest.fixture
+def session_factory(rollback_session_factory):
+    """Session factory over the shared engine, rolled back after each test."""
+    return rollback_session_factory
 
 
 @pytest_asyncio.fixture
@@ -27,28 +24,42 @@ async def service(session_factory):
     return DatasetService(session_factory=session_factory)
 
 
-@pytest_asyncio.fixture
-async def sample_dataset(tmp_path):
-    """Create a sample JSONL file on disk."""
-    path = tmp_path / "sample.jsonl"
-    path.write_text('{"text": "hello"}\n{"text": "world"}\n{"text": "test"}\n')
+@pytest.fixture
+def bulk_register(session_factory):
+    """Insert Dataset rows directly in one commit, for tests that only read them back."""
+
+    async def _bulk_register(*specs: dict) -> None:
+        rows = [
+            {"id": str(uuid.uuid4()), "registered_by": "manual", "status": "registered", **spec}
+            for spec in specs
+        ]
+        async with session_factory() as session:
+            await session.execute(insert(Dataset), rows)
+            await session.commit()
+
+    return _bulk_register
+
+
+@pytest.fixture(scope="session")
+def sample_dataset(tmp_path_factory):
+    """Create a sample JSONL file on disk (read-only, shared)."""
+    path = tmp_path_factory.mktemp("datasets") / "sample.jsonl"
+    path.write_bytes(b'{"text": "hello"}\n{"text": "world"}\n{"text": "test"}\n')
     return path
 
 
-@pytest_asyncio.fixture
-async def sample_csv(tmp_path):
-    """Create a sample CSV file on disk."""
-    path = tmp_path / "sample.csv"
-    path.write_text("prompt,response\nhello,world\nfoo,bar\n")
+@pytest.fixture(scope="session")
+def sample_csv(tmp_path_factory):
+    """Create a sample CSV file on disk (read-only, shared)."""
+    path = tmp_path_factory.mktemp("datasets") / "sample.csv"
+    path.write_bytes(b"prompt,response\nhello,world\nfoo,bar\n")
     return path
 
 
 # ── create_dataset ───────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_create_dataset(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
     result = await service.create_dataset(DatasetCreate(
         name="Test Dataset",
         source_path=str(sample_dataset),
@@ -65,9 +76,7 @@ async def test_create_dataset(service, sample_dataset):
     assert result.file_size_bytes > 0
 
 
-@pytest.mark.asyncio
 async def test_create_dataset_no_file(service):
-    from app.schemas.dataset import DatasetCreate
     result = await service.create_dataset(DatasetCreate(
         name="Remote",
         source_path="/nonexistent/path.csv",
@@ -79,9 +88,7 @@ async def test_create_dataset_no_file(service):
 # ── get_dataset ──────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_get_dataset(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
     created = await service.create_dataset(DatasetCreate(
         name="Get Test", source_path=str(sample_dataset), format="jsonl",
     ))
@@ -90,9 +97,7 @@ async def test_get_dataset(service, sample_dataset):
     assert fetched.name == "Get Test"
 
 
-@pytest.mark.asyncio
 async def test_get_dataset_not_found(service):
-    from app.core.exceptions import NotFoundError
     with pytest.raises(NotFoundError):
         await service.get_dataset("nonexistent-uuid")
 
@@ -100,33 +105,24 @@ async def test_get_dataset_not_found(service):
 # ── list_datasets ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_list_datasets_empty(service):
     result = await service.list_datasets()
     assert result.total == 0
     assert result.datasets == []
 
 
-@pytest.mark.asyncio
-async def test_list_datasets_with_filter(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
-    await service.create_dataset(DatasetCreate(
-        name="Train", source_path=str(sample_dataset),
-        dataset_type="training", format="jsonl",
-    ))
-    await service.create_dataset(DatasetCreate(
-        name="Eval", source_path=str(sample_dataset),
-        dataset_type="eval", format="jsonl",
-    ))
+async def test_list_datasets_with_filter(service, bulk_register, sample_dataset):
+    await bulk_register(
+        dict(name="Train", source_path=str(sample_dataset), dataset_type="training", format="jsonl"),
+        dict(name="Eval", source_path=str(sample_dataset), dataset_type="eval", format="jsonl"),
+    )
 
     result = await service.list_datasets(dataset_type="training")
     assert result.total == 1
     assert result.datasets[0].name == "Train"
 
 
-@pytest.mark.asyncio
 async def test_list_datasets_search(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
     await service.create_dataset(DatasetCreate(
         name="Alpha Dataset", source_path=str(sample_dataset), format="jsonl",
     ))
@@ -138,13 +134,11 @@ async def test_list_datasets_search(service, sample_dataset):
     assert result.total == 1
 
 
-@pytest.mark.asyncio
-async def test_list_datasets_pagination(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
-    for i in range(5):
-        await service.create_dataset(DatasetCreate(
-            name=f"DS-{i}", source_path=str(sample_dataset), format="jsonl",
-        ))
+async def test_list_datasets_pagination(service, bulk_register, sample_dataset):
+    await bulk_register(*(
+        dict(name=f"DS-{i}", source_path=str(sample_dataset), dataset_type="training", format="jsonl")
+        for i in range(5)
+    ))
     result = await service.list_datasets(offset=2, limit=2)
     assert len(result.datasets) == 2
     assert result.total == 5
@@ -153,9 +147,7 @@ async def test_list_datasets_pagination(service, sample_dataset):
 # ── update_dataset ───────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_update_dataset(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate, DatasetUpdate
     created = await service.create_dataset(DatasetCreate(
         name="Original", source_path=str(sample_dataset), format="jsonl",
     ))
@@ -169,23 +161,18 @@ async def test_update_dataset(service, sample_dataset):
 # ── delete_dataset ───────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_delete_dataset(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
     created = await service.create_dataset(DatasetCreate(
         name="ToDelete", source_path=str(sample_dataset), format="jsonl",
     ))
     await service.delete_dataset(created.id)
-    from app.core.exceptions import NotFoundError
     with pytest.raises(NotFoundError):
         await service.get_dataset(created.id)
 
 
-@pytest.mark.asyncio
 async def test_delete_dataset_with_file(service, tmp_path):
-    from app.schemas.dataset import DatasetCreate
     file_path = tmp_path / "deleteme.jsonl"
-    file_path.write_text('{"a": 1}\n')
+    file_path.write_bytes(b'{"a": 1}\n')
     created = await service.create_dataset(DatasetCreate(
         name="Delete File", source_path=str(file_path), format="jsonl",
     ))
@@ -197,11 +184,8 @@ async def test_delete_dataset_with_file(service, tmp_path):
 # ── upload_dataset ───────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_upload_dataset(service, tmp_path):
-    from app.config import settings
-    original_dir = settings.vault_datasets_dir
-    settings.vault_datasets_dir = str(tmp_path / "uploads")
+async def test_upload_dataset(service, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "vault_datasets_dir", str(tmp_path / "uploads"))
 
     content = b'{"text": "uploaded"}\n'
     result = await service.upload_dataset(
@@ -215,15 +199,11 @@ async def test_upload_dataset(service, tmp_path):
     assert result.file_size_bytes == len(content)
     assert result.status == "uploaded"
 
-    settings.vault_datasets_dir = original_dir
-
 
 # ── validate_dataset ─────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_validate_jsonl(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
     created = await service.create_dataset(DatasetCreate(
         name="Validate", source_path=str(sample_dataset), format="jsonl",
     ))
@@ -233,11 +213,9 @@ async def test_validate_jsonl(service, sample_dataset):
     assert result.errors == []
 
 
-@pytest.mark.asyncio
 async def test_validate_invalid_jsonl(service, tmp_path):
-    from app.schemas.dataset import DatasetCreate
     bad_file = tmp_path / "bad.jsonl"
-    bad_file.write_text('{"valid": true}\nnot json\n')
+    bad_file.write_bytes(b'{"valid": true}\nnot json\n')
     created = await service.create_dataset(DatasetCreate(
         name="Bad JSONL", source_path=str(bad_file), format="jsonl",
     ))
@@ -246,9 +224,7 @@ async def test_validate_invalid_jsonl(service, tmp_path):
     assert len(result.errors) > 0
 
 
-@pytest.mark.asyncio
 async def test_validate_csv(service, sample_csv):
-    from app.schemas.dataset import DatasetCreate
     created = await service.create_dataset(DatasetCreate(
         name="CSV", source_path=str(sample_csv), format="csv",
     ))
@@ -257,9 +233,7 @@ async def test_validate_csv(service, sample_csv):
     assert result.record_count == 2  # 2 data rows, 1 header
 
 
-@pytest.mark.asyncio
 async def test_validate_missing_file(service):
-    from app.schemas.dataset import DatasetCreate
     created = await service.create_dataset(DatasetCreate(
         name="Missing", source_path="/nonexistent/data.jsonl", format="jsonl",
     ))
@@ -271,9 +245,7 @@ async def test_validate_missing_file(service):
 # ── preview_dataset ──────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_preview_jsonl(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
     created = await service.create_dataset(DatasetCreate(
         name="Preview", source_path=str(sample_dataset), format="jsonl",
     ))
@@ -282,9 +254,7 @@ async def test_preview_jsonl(service, sample_dataset):
     assert result.preview_records[0]["text"] == "hello"
 
 
-@pytest.mark.asyncio
 async def test_preview_csv(service, sample_csv):
-    from app.schemas.dataset import DatasetCreate
     created = await service.create_dataset(DatasetCreate(
         name="CSV Preview", source_path=str(sample_csv), format="csv",
     ))
@@ -296,15 +266,11 @@ async def test_preview_csv(service, sample_csv):
 # ── get_stats ────────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_get_stats(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
-    await service.create_dataset(DatasetCreate(
-        name="A", source_path=str(sample_dataset), dataset_type="training", format="jsonl",
-    ))
-    await service.create_dataset(DatasetCreate(
-        name="B", source_path=str(sample_dataset), dataset_type="eval", format="csv",
-    ))
+async def test_get_stats(service, bulk_register, sample_dataset):
+    await bulk_register(
+        dict(name="A", source_path=str(sample_dataset), dataset_type="training", format="jsonl"),
+        dict(name="B", source_path=str(sample_dataset), dataset_type="eval", format="csv"),
+    )
     stats = await service.get_stats()
     assert stats.total_datasets == 2
     assert stats.by_type["training"] == 1
@@ -316,15 +282,11 @@ async def test_get_stats(service, sample_dataset):
 # ── list_by_type ─────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_list_by_type(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
-    await service.create_dataset(DatasetCreate(
-        name="Train1", source_path=str(sample_dataset), dataset_type="training", format="jsonl",
-    ))
-    await service.create_dataset(DatasetCreate(
-        name="Eval1", source_path=str(sample_dataset), dataset_type="eval", format="jsonl",
-    ))
+async def test_list_by_type(service, bulk_register, sample_dataset):
+    await bulk_register(
+        dict(name="Train1", source_path=str(sample_dataset), dataset_type="training", format="jsonl"),
+        dict(name="Eval1", source_path=str(sample_dataset), dataset_type="eval", format="jsonl"),
+    )
     result = await service.list_by_type("training")
     assert result.total == 1
     assert result.datasets[0].name == "Train1"
@@ -333,9 +295,7 @@ async def test_list_by_type(service, sample_dataset):
 # ── resolve_dataset_path ────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
 async def test_resolve_by_uuid(service, sample_dataset):
-    from app.schemas.dataset import DatasetCreate
     created = await service.create_dataset(DatasetCreate(
         name="Resolve", source_path=str(sample_dataset), format="jsonl",
     ))
@@ -343,7 +303,6 @@ async def test_resolve_by_uuid(service, sample_dataset):
     assert resolved == str(sample_dataset)
 
 
-@pytest.mark.asyncio
 async def test_resolve_passthrough(service):
     result = await service.resolve_dataset_path("/some/arbitrary/path.jsonl")
     assert result == "/some/arbitrary/path.jsonl"
@@ -80,7 +80,8 @@ def test_quick_eval_request_valid():
 
 
 def test_quick_eval_request_max_cases():
-    cases = [QuickEvalCase(prompt=f"Q{i}?") for i in range(50)]
+    # Cases are validated in test_quick_eval_request_valid; only the list limit matters here.
+    cases = [QuickEvalCase.model_construct(prompt=f"Q{i}?") for i in range(50)]
     req = QuickEvalRequest(model_id="qwen2.5", test_cases=cases)
     assert len(req.test_cases) == 50
 
@@ -14,59 +14,65 @@ from app.services.eval.scoring import (
 
 
 class TestAccuracy:
-    def test_exact_match(self):
-        assert accuracy("Paris", "Paris") == 1.0
-
-    def test_case_insensitive(self):
-        assert accuracy("paris", "Paris") == 1.0
-
-    def test_strips_whitespace(self):
-        assert accuracy("  Paris  ", "Paris") == 1.0
-
-    def test_removes_articles(self):
-        assert accuracy("The capital is Paris", "capital is Paris") == 1.0
-
-    def test_no_match(self):
-        assert accuracy("London", "Paris") == 0.0
+    @pytest.mark.parametrize(
+        "generated, expected, score",
+        [
+            ("Paris", "Paris", 1.0),
+            ("paris", "Paris", 1.0),
+            ("  Paris  ", "Paris", 1.0),
+            ("The capital is Paris", "capital is Paris", 1.0),
+            ("London", "Paris", 0.0),
+        ],
+        ids=["exact_match", "case_insensitive", "strips_whitespace", "removes_articles", "no_match"],
+    )
+    def test_accuracy(self, generated, expected, score):
+        assert accuracy(generated, expected) == score
 
 
 class TestExactMatch:
-    def test_match(self):
-        assert exact_match("Paris", "Paris") == 1.0
-
-    def test_case_sensitive(self):
-        assert exact_match("paris", "Paris") == 0.0
-
-    def test_strips_whitespace(self):
-        assert exact_match("  Paris  ", "Paris") == 1.0
+    @pytest.mark.parametrize(
+        "generated, expected, score",
+        [
+            ("Paris", "Paris", 1.0),
+            ("paris", "Paris", 0.0),
+            ("  Paris  ", "Paris", 1.0),
+        ],
+        ids=["match", "case_sensitive", "strips_whitespace"],
+    )
+    def test_exact_match(self, generated, expected, score):
+        assert exact_match(generated, expected) == score
 
 
 class TestF1:
-    def test_identical(self):
-        assert f1_score("the quick brown fox", "the quick brown fox") == 1.0
+    @pytest.mark.parametrize(
+        "generated, expected, score",
+        [
+            ("the quick brown fox", "the quick brown fox", 1.0),
+            ("hello world", "foo bar", 0.0),
+            ("", "", 1.0),
+            ("", "hello", 0.0),
+        ],
+        ids=["identical", "no_overlap", "empty_both", "empty_one"],
+    )
+    def test_f1(self, generated, expected, score):
+        assert f1_score(generated, expected) == score
 
     def test_partial_overlap(self):
         score = f1_score("the quick brown fox", "the slow brown cat")
         assert 0.0 < score < 1.0
 
-    def test_no_overlap(self):
-        assert f1_score("hello world", "foo bar") == 0.0
-
-    def test_empty_both(self):
-        assert f1_score("", "") == 1.0
-
-    def test_empty_one(self):
-        assert f1_score("", "hello") == 0.0
-
 
 class TestBleu:
-    def test_identical(self):
-        score = bleu_score("the cat sat on the mat", "the cat sat on the mat")
-        assert score == 1.0
-
-    def test_no_overlap(self):
-        score = bleu_score("hello world foo bar", "completely different text here")
-        assert score == 0.0
+    @pytest.mark.parametrize(
+        "generated, expected, score",
+        [
+            ("the cat sat on the mat", "the cat sat on the mat", 1.0),
+            ("hello world foo bar", "completely different text here", 0.0),
+        ],
+        ids=["identical", "no_overlap"],
+    )
+    def test_bleu(self, generated, expected, score):
+        assert bleu_score(generated, expected) == score
 
     def test_partial(self):
         score = bleu_score("the cat sat on the mat", "the cat sat on a mat")
@@ -74,16 +80,21 @@ class TestBleu:
 
 
 class TestRougeL:
-    def test_identical(self):
-        assert rouge_l("the quick brown fox", "the quick brown fox") == 1.0
+    @pytest.mark.parametrize(
+        "generated, expected, score",
+        [
+            ("the quick brown fox", "the quick brown fox", 1.0),
+            ("hello world", "foo bar", 0.0),
+        ],
+        ids=["identical", "no_overlap"],
+    )
+    def test_rouge_l(self, generated, expected, score):
+        assert rouge_l(generated, expected) == score
 
     def test_subsequence(self):
         score = rouge_l("the brown fox", "the quick brown fox")
         assert 0.0 < score <= 1.0
 
-    def test_no_overlap(self):
-        assert rouge_l("hello world", "foo bar") == 0.0
-
 
 class TestScoreExample:
     def test_single_metric(self):
@@ -1,25 +1,16 @@
 """Unit tests for EvalService CRUD and state machine."""
 
 import pytest
-import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.core.database import Base
 from app.core.exceptions import NotFoundError, VaultError
 from app.schemas.eval import EvalConfig, EvalJobCreate
 from app.services.eval.service import EvalService
 
 
-@pytest_asyncio.fixture
-async def eval_service():
-    """EvalService backed by in-memory SQLite."""
-    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    service = EvalService(session_factory=session_factory)
-    yield service
-    await engine.dispose()
+@pytest.fixture
+def eval_service(rollback_session_factory):
+    """EvalService on the shared in-memory engine, rolled back after each test."""
+    return EvalService(session_factory=rollback_session_factory)
 
 
 @pytest.fixture
@@ -167,9 +158,8 @@ async def test_compare_jobs_same_dataset(eval_service):
         EvalJobCreate(name="B", model_id="m", dataset_id="ds2")
     )
     # Mark both as completed
-    import json
-    await eval_service.update_job_status(j1.id, status="completed", results_json=json.dumps({"metrics": []}))
-    await eval_service.update_job_status(j2.id, status="completed", results_json=json.dumps({"metrics": []}))
+    await eval_service.update_job_status(j1.id, status="completed", results_json='{"metrics": []}')
+    await eval_service.update_job_status(j2.id, status="completed", results_json='{"metrics": []}')
     with pytest.raises(VaultError) as exc_info:
         await eval_service.compare_jobs([j1.id, j2.id])
     assert "same dataset" in exc_info.value.message
@@ -177,14 +167,13 @@ async def test_compare_jobs_same_dataset(eval_service):
 
 @pytest.mark.asyncio
 async def test_compare_jobs_success(eval_service):
-    import json
     j1 = await eval_service.create_job(
         EvalJobCreate(name="Base", model_id="m1", dataset_id="mmlu")
     )
     j2 = await eval_service.create_job(
         EvalJobCreate(name="Tuned", model_id="m1", adapter_id="a1", dataset_id="mmlu")
     )
-    results_json = json.dumps({"metrics": [{"metric": "accuracy", "score": 0.85}]})
+    results_json = '{"metrics": [{"metric": "accuracy", "score": 0.85}]}'
     await eval_service.update_job_status(j1.id, status="completed", results_json=results_json)
     await eval_service.update_job_status(j2.id, status="completed", results_json=results_json)
     compare = await eval_service.compare_jobs([j1.id, j2.id])
@@ -29,6 +29,18 @@ def default_config():
 FIXTURES = Path(__file__).parent.parent / "fixtures" / "quarantine"
 
 
+@pytest.fixture(scope="session")
+def nested_zip_bytes():
+    """A zip nested four levels deep (outer > middle > inner > deep.txt), stored uncompressed."""
+    payload = b"deep file"
+    for name in ("deep.txt", "inner.zip", "middle.zip", "outer.zip"):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
+            zf.writestr(name, payload)
+        payload = buf.getvalue()
+    return payload
+
+
 class TestMimeValidation:
     @pytest.mark.asyncio
     async def test_clean_pdf_passes(self, stage, default_config):
@@ -136,34 +148,10 @@ class TestArchiveBombs:
         assert len(bomb_findings) == 0
 
     @pytest.mark.asyncio
-    async def test_nested_zip_depth(self, stage, tmp_path):
+    async def test_nested_zip_depth(self, stage, tmp_path, nested_zip_bytes):
         """Create a zip-in-zip-in-zip and verify depth detection."""
-        # Create inner zip
-        inner_buf = io.BytesIO()
-        with zipfile.ZipFile(inner_buf, "w") as zf:
-            zf.writestr("deep.txt", "deep file")
-        inner_buf.seek(0)
-
-        # Create middle zip containing inner
-        mid_buf = io.BytesIO()
-        with zipfile.ZipFile(mid_buf, "w") as zf:
-            zf.writestr("inner.zip", inner_buf.read())
-        mid_buf.seek(0)
-
-        # Create outer zip containing middle
-        outer_buf = io.BytesIO()
-        with zipfile.ZipFile(outer_buf, "w") as zf:
-            zf.writestr("middle.zip", mid_buf.read())
-        outer_buf.seek(0)
-
-        # Wrap in one more level
-        final_buf = io.BytesIO()
-        with zipfile.ZipFile(final_buf, "w") as zf:
-            zf.writestr("outer.zip", outer_buf.read())
-        final_buf.seek(0)
-
         nested = tmp_path / "nested.zip"
-        nested.write_bytes(final_buf.read())
+        nested.write_bytes(nested_zip_bytes)
 
         config = {"max_compression_ratio": 1000, "max_archive_depth": 2, "max_file_size": 1073741824}
         result = await stage.scan(nested, "nested.zip", config)
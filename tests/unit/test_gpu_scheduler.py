@@ -1,5 +1,7 @@
 """Unit tests for GPUScheduler."""
 
+from functools import lru_cache
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -13,14 +15,15 @@ def scheduler():
     return GPUScheduler()
 
 
-def _mock_gpus(memory_used_pct=0.5):
-    """Create mock GPU info."""
+@lru_cache(maxsize=8)
+def _mock_gpus(memory_used_pct=0.5) -> tuple[GpuInfo, ...]:
+    """Create mock GPU info (cached; the scheduler only reads it)."""
     total_mb = 32768  # 32GB
     used_mb = int(total_mb * memory_used_pct)
-    return [
+    return (
         GpuInfo(index=0, name="RTX 5090", memory_total_mb=total_mb, memory_used_mb=used_mb, utilization_pct=30.0),
         GpuInfo(index=1, name="RTX 5090", memory_total_mb=total_mb, memory_used_mb=1024, utilization_pct=5.0),
-    ]
+    )
 
 
 class TestGPUScheduler:
@@ -32,7 +35,7 @@ class TestGPUScheduler:
             "training.gpu_index": "1",
             "training.max_memory_pct": "0.9",
         }):
-            with patch("app.services.training.scheduler.get_gpu_info", return_value=_mock_gpus()):
+            with patch("app.services.training.scheduler.get_gpu_info", return_value=list(_mock_gpus())):
                 allowed, reason = await scheduler.can_start_training()
                 assert allowed is True
                 assert reason == "ok"
@@ -68,7 +71,7 @@ class TestGPUScheduler:
             "training.gpu_index": "1",
             "training.max_memory_pct": "0.9",
         }):
-            with patch("app.services.training.scheduler.get_gpu_info", return_value=_mock_gpus()):
+            with patch("app.services.training.scheduler.get_gpu_info", return_value=list(_mock_gpus())):
                 gpu_index = await scheduler.acquire_gpu_for_training("job-1")
                 assert gpu_index == 1
                 assert scheduler.active_job_id == "job-1"
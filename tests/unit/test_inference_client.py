@@ -1,3 +1,4 @@
+import functools
 import json
 
 import httpx
@@ -11,8 +12,9 @@ from app.services.inference.vllm_client import VLLMBackend, _classify_model_type
 from tests.mocks.fake_vllm import app as fake_vllm_app
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module")
 async def vllm_backend():
+    """One backend and ASGI client for the module; VLLMBackend keeps no per-request state."""
     transport = ASGITransport(app=fake_vllm_app)
     client = httpx.AsyncClient(transport=transport, base_url="http://fakevllm")
     backend = VLLMBackend(base_url="http://fakevllm", http_client=client)
@@ -20,7 +22,21 @@ async def vllm_backend():
     await client.aclose()
 
 
+def _refuse_connection(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("Connection refused", request=request)
+
+
+def _unreachable_backend() -> VLLMBackend:
+    """Backend whose transport fails like a closed port, without touching the network."""
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_refuse_connection), base_url="http://localhost:19999"
+    )
+    return VLLMBackend(base_url="http://localhost:19999", http_client=client)
+
+
+@functools.cache
 def _make_request(stream: bool = False) -> ChatCompletionRequest:
+    """Build (once per stream flag) a request; the backend only reads it."""
     return ChatCompletionRequest(
         model="qwen2.5-32b-awq",
         messages=[ChatMessage(role="user", content="Hello")],
@@ -31,18 +47,14 @@ def _make_request(stream: bool = False) -> ChatCompletionRequest:
 async def test_streaming_chat(vllm_backend: VLLMBackend):
     """Streaming chat returns SSE-formatted lines with data: prefix."""
     request = _make_request(stream=True)
-    chunks = []
-    async for line in vllm_backend.chat_completion(request):
-        chunks.append(line.strip())
-
-    # Each non-empty line should start with "data: "
-    data_lines = [c for c in chunks if c]
-    assert len(data_lines) > 0
-
-    # All content lines (not [DONE]) should be valid JSON after stripping "data: "
-    for line in data_lines:
-        assert line.startswith("data: ")
-        payload = line.removeprefix("data: ")
+    lines = [line async for line in vllm_backend.chat_completion(request)]
+    assert len(lines) > 0
+
+    # The backend drops blank SSE separators and yields one "data: ...\n" line
+    # per event; every payload except [DONE] is a JSON chunk.
+    for line in lines:
+        assert line.startswith("data: ") and line.endswith("\n")
+        payload = line[6:-1]
         if payload == "[DONE]":
             continue
         parsed = json.loads(payload)
@@ -66,11 +78,11 @@ async def test_non_streaming_chat(vllm_backend: VLLMBackend):
 
 async def test_list_models(vllm_backend: VLLMBackend):
     """List models returns available models with rich metadata from Ollama-style backend."""
-    models = await vllm_backend.list_models()
+    models = {m.id: m for m in await vllm_backend.list_models()}
     assert len(models) == 2
 
     # Chat model
-    chat_model = next(m for m in models if m.id == "qwen2.5-32b-awq:latest")
+    chat_model = models["qwen2.5-32b-awq:latest"]
     assert chat_model.name == "qwen2.5-32b-awq"
     assert chat_model.type == "chat"
     assert chat_model.status == "running"
@@ -80,7 +92,7 @@ async def test_list_models(vllm_backend: VLLMBackend):
     assert chat_model.context_window == 32768
 
     # Embedding model
-    embed_model = next(m for m in models if m.id == "nomic-embed-text:latest")
+    embed_model = models["nomic-embed-text:latest"]
     assert embed_model.name == "nomic-embed-text"
     assert embed_model.type == "embedding"
     assert embed_model.status == "available"
@@ -96,7 +108,7 @@ async def test_health_check_ok(vllm_backend: VLLMBackend):
 
 async def test_health_check_connection_error():
     """Health check returns False when vLLM is unreachable."""
-    backend = VLLMBackend(base_url="http://localhost:19999")
+    backend = _unreachable_backend()
     result = await backend.health_check()
     assert result is False
     await backend.close()
@@ -150,7 +162,7 @@ async def test_health_check_all_probes_fail():
 
 async def test_chat_connection_error():
     """Chat completion raises BackendUnavailableError when vLLM is unreachable."""
-    backend = VLLMBackend(base_url="http://localhost:19999")
+    backend = _unreachable_backend()
     request = _make_request(stream=False)
 
     with pytest.raises(BackendUnavailableError):
@@ -163,36 +175,23 @@ async def test_chat_connection_error():
 # ── Model type classification tests ──────────────────────────────────────────
 
 
-class TestClassifyModelType:
-    def test_chat_by_default(self):
-        assert _classify_model_type(None, "qwen2.5-32b-awq") == "chat"
-
-    def test_chat_family(self):
-        assert _classify_model_type("qwen2", "qwen2.5-32b-awq:latest") == "chat"
-
-    def test_embedding_family_bert(self):
-        assert _classify_model_type("bert", "some-bert-model") == "embedding"
-
-    def test_embedding_family_nomic_bert(self):
-        assert _classify_model_type("nomic-bert", "nomic-embed-text:latest") == "embedding"
-
-    def test_embedding_family_mxbai(self):
-        assert _classify_model_type("mxbai", "mxbai-embed-large") == "embedding"
-
-    def test_embedding_name_keyword_embed(self):
-        assert _classify_model_type(None, "nomic-embed-text:latest") == "embedding"
-
-    def test_embedding_name_keyword_bge(self):
-        assert _classify_model_type(None, "bge-large-en-v1.5") == "embedding"
-
-    def test_embedding_name_keyword_e5(self):
-        assert _classify_model_type(None, "e5-large-v2") == "embedding"
-
-    def test_embedding_name_keyword_gte(self):
-        assert _classify_model_type(None, "gte-base") == "embedding"
-
-    def test_unknown_family_defaults_chat(self):
-        assert _classify_model_type("llama", "llama-3.3-8b:latest") == "chat"
+@pytest.mark.parametrize(
+    "family, name, expected",
+    [
+        pytest.param(None, "qwen2.5-32b-awq", "chat", id="chat_by_default"),
+        pytest.param("qwen2", "qwen2.5-32b-awq:latest", "chat", id="chat_family"),
+        pytest.param("bert", "some-bert-model", "embedding", id="embedding_family_bert"),
+        pytest.param("nomic-bert", "nomic-embed-text:latest", "embedding", id="embedding_family_nomic_bert"),
+        pytest.param("mxbai", "mxbai-embed-large", "embedding", id="embedding_family_mxbai"),
+        pytest.param(None, "nomic-embed-text:latest", "embedding", id="embedding_name_keyword_embed"),
+        pytest.param(None, "bge-large-en-v1.5", "embedding", id="embedding_name_keyword_bge"),
+        pytest.param(None, "e5-large-v2", "embedding", id="embedding_name_keyword_e5"),
+        pytest.param(None, "gte-base", "embedding", id="embedding_name_keyword_gte"),
+        pytest.param("llama", "llama-3.3-8b:latest", "chat", id="unknown_family_defaults_chat"),
+    ],
+)
+def test_classify_model_type(family, name, expected):
+    assert _classify_model_type(family, name) == expected
 
 
 # ── Running status tests ─────────────────────────────────────────────────────
@@ -200,10 +199,8 @@ class TestClassifyModelType:
 
 async def test_running_status_from_api_ps(vllm_backend: VLLMBackend):
     """Models listed in /api/ps are marked as running."""
-    models = await vllm_backend.list_models()
-    running = [m for m in models if m.status == "running"]
-    available = [m for m in models if m.status == "available"]
-    assert len(running) == 1
-    assert running[0].id == "qwen2.5-32b-awq:latest"
-    assert len(available) == 1
-    assert available[0].id == "nomic-embed-text:latest"
+    statuses = {m.id: m.status for m in await vllm_backend.list_models()}
+    assert statuses == {
+        "qwen2.5-32b-awq:latest": "running",
+        "nomic-embed-text:latest": "available",
+    }
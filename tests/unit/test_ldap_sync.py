@@ -1,35 +1,32 @@
 """Unit tests for LDAP sync service."""
 
 import pytest
-import pytest_asyncio
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from unittest.mock import AsyncMock
 
-from app.core.database import Base, LdapGroupMapping, User
+from app.core.database import LdapGroupMapping, User
 from app.services.ldap_sync import LdapSyncService
 
 
-@pytest_asyncio.fixture
-async def sync_engine():
-    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield engine
-    await engine.dispose()
+class _FakeLdap:
+    """Minimal LdapService stand-in: sync only calls search_users()."""
 
+    def __init__(self, users: list[dict]):
+        self._users = users
 
-@pytest_asyncio.fixture
-async def sync_session_factory(sync_engine):
-    return async_sessionmaker(sync_engine, class_=AsyncSession, expire_on_commit=False)
+    async def search_users(self) -> list[dict]:
+        return self._users
+
+
+@pytest.fixture
+def sync_session_factory(rollback_session_factory):
+    """Session factory over the shared engine, rolled back after each test."""
+    return rollback_session_factory
 
 
 class TestLdapSyncFullSync:
 
-    @pytest.mark.asyncio
     async def test_creates_new_users(self, sync_session_factory):
-        mock_ldap = AsyncMock()
-        mock_ldap.search_users.return_value = [
+        mock_ldap = _FakeLdap([
             {
                 "dn": "cn=John,ou=Users,dc=test",
                 "username": "john",
@@ -46,7 +43,7 @@ class TestLdapSyncFullSync:
                 "groups": [],
                 "disabled": False,
             },
-        ]
+        ])
 
         sync_svc = LdapSyncService(
             ldap_service=mock_ldap,
@@ -66,7 +63,6 @@ class TestLdapSyncFullSync:
             assert len(users) == 2
             assert all(u.auth_source == "ldap" for u in users)
 
-    @pytest.mark.asyncio
     async def test_updates_existing_users(self, sync_session_factory):
         # Pre-create user
         async with sync_session_factory() as session:
@@ -82,8 +78,7 @@ class TestLdapSyncFullSync:
             session.add(user)
             await session.commit()
 
-        mock_ldap = AsyncMock()
-        mock_ldap.search_users.return_value = [
+        mock_ldap = _FakeLdap([
             {
                 "dn": "cn=John,ou=Users,dc=test",
                 "username": "john",
@@ -92,7 +87,7 @@ class TestLdapSyncFullSync:
                 "groups": [],
                 "disabled": False,
             },
-        ]
+        ])
 
         sync_svc = LdapSyncService(
             ldap_service=mock_ldap,
@@ -107,7 +102,6 @@ class TestLdapSyncFullSync:
             user = (await session.execute(select(User).where(User.id == "existing-1"))).scalar_one()
             assert user.name == "John Updated"
 
-    @pytest.mark.asyncio
     async def test_deactivates_removed_users(self, sync_session_factory):
         # Pre-create LDAP user
         async with sync_session_factory() as session:
@@ -124,8 +118,7 @@ class TestLdapSyncFullSync:
             await session.commit()
 
         # Sync returns empty (user no longer in directory)
-        mock_ldap = AsyncMock()
-        mock_ldap.search_users.return_value = []
+        mock_ldap = _FakeLdap([])
 
         sync_svc = LdapSyncService(
             ldap_service=mock_ldap,
@@ -139,7 +132,6 @@ class TestLdapSyncFullSync:
             user = (await session.execute(select(User).where(User.id == "removed-1"))).scalar_one()
             assert user.status == "inactive"
 
-    @pytest.mark.asyncio
     async def test_role_resolution_from_group_mappings(self, sync_session_factory):
         # Create a group mapping
         async with sync_session_factory() as session:
@@ -151,8 +143,7 @@ class TestLdapSyncFullSync:
             session.add(mapping)
             await session.commit()
 
-        mock_ldap = AsyncMock()
-        mock_ldap.search_users.return_value = [
+        mock_ldap = _FakeLdap([
             {
                 "dn": "cn=Admin User,ou=Users,dc=test",
                 "username": "adminuser",
@@ -161,7 +152,7 @@ class TestLdapSyncFullSync:
                 "groups": ["cn=admins,ou=Groups,dc=test"],
                 "disabled": False,
             },
-        ]
+        ])
 
         sync_svc = LdapSyncService(
             ldap_service=mock_ldap,
@@ -178,10 +169,8 @@ class TestLdapSyncFullSync:
             )).scalar_one()
             assert user.role == "admin"
 
-    @pytest.mark.asyncio
     async def test_disabled_users_get_inactive_status(self, sync_session_factory):
-        mock_ldap = AsyncMock()
-        mock_ldap.search_users.return_value = [
+        mock_ldap = _FakeLdap([
             {
                 "dn": "cn=Disabled,ou=Users,dc=test",
                 "username": "disabled",
@@ -190,7 +179,7 @@ class TestLdapSyncFullSync:
                 "groups": [],
                 "disabled": True,
             },
-        ]
+        ])
 
         sync_svc = LdapSyncService(
             ldap_service=mock_ldap,
@@ -204,10 +193,8 @@ class TestLdapSyncFullSync:
             )).scalar_one()
             assert user.status == "inactive"
 
-    @pytest.mark.asyncio
     async def test_sync_handles_errors_gracefully(self, sync_session_factory):
-        mock_ldap = AsyncMock()
-        mock_ldap.search_users.return_value = [
+        mock_ldap = _FakeLdap([
             {
                 "dn": "",  # Empty DN — should be skipped
                 "username": "nodn",
@@ -224,7 +211,7 @@ class TestLdapSyncFullSync:
                 "groups": [],
                 "disabled": False,
             },
-        ]
+        ])
 
         sync_svc = LdapSyncService(
             ldap_service=mock_ldap,
@@ -235,7 +222,6 @@ class TestLdapSyncFullSync:
         # Empty DN is skipped, good user is created
         assert result["users_created"] == 1
 
-    @pytest.mark.asyncio
     async def test_links_existing_local_user_by_email(self, sync_session_factory):
         """If a local user exists with the same email, link them to LDAP."""
         async with sync_session_factory() as session:
@@ -250,8 +236,7 @@ class TestLdapSyncFullSync:
             session.add(user)
             await session.commit()
 
-        mock_ldap = AsyncMock()
-        mock_ldap.search_users.return_value = [
+        mock_ldap = _FakeLdap([
             {
                 "dn": "cn=LDAP User,ou=Users,dc=test",
                 "username": "ldapuser",
@@ -260,7 +245,7 @@ class TestLdapSyncFullSync:
                 "groups": [],
                 "disabled": False,
             },
-        ]
+        ])
 
         sync_svc = LdapSyncService(
             ldap_service=mock_ldap,
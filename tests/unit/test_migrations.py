@@ -1,11 +1,13 @@
 """Tests for Alembic migration integration."""
 
+import shutil
 from unittest.mock import patch
 
 import pytest
 from alembic import command
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.core.database import Base
 from app.core.migrations import _BACKEND_ROOT, ensure_db_migrated
@@ -24,18 +26,56 @@ def _test_cfg(connection):
     return cfg
 
 
+def _scratch_engine(db_path):
+    """Sync engine for a throwaway SQLite file, with journaling and fsync off."""
+    engine = create_engine(f"sqlite:///{db_path}")
+
+    @event.listens_for(engine, "connect")
+    def _fast_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+
+    return engine
+
+
+def _tables_and_revision(connection) -> tuple[set[str], str | None]:
+    """Table names and stamped Alembic revision (sync, for use with run_sync)."""
+    tables = set(inspect(connection).get_table_names())
+    revision = None
+    if "alembic_version" in tables:
+        row = connection.execute(text("SELECT version_num FROM alembic_version")).first()
+        revision = row[0] if row else None
+    return tables, revision
+
+
+def _table_columns(connection) -> dict[str, set[str]]:
+    """Map each table to its column names using a single inspector."""
+    insp = inspect(connection)
+    return {t: {c["name"] for c in insp.get_columns(t)} for t in insp.get_table_names()}
+
+
+@pytest.fixture(scope="module")
+def head_db(tmp_path_factory):
+    """SQLite file migrated to head once per module (treat as read-only)."""
+    db_path = tmp_path_factory.mktemp("alembic") / "head.db"
+    engine = _scratch_engine(db_path)
+    with engine.begin() as conn:
+        command.upgrade(_test_cfg(conn), "head")
+    engine.dispose()
+    return db_path
+
+
 # ── Migration Chain Tests (sync, isolated SQLite) ────────────────────────────
 
 
 class TestMigrationChain:
     """Test Alembic migration files produce the correct schema."""
 
-    def test_upgrade_to_head_creates_all_tables(self, tmp_path):
+    def test_upgrade_to_head_creates_all_tables(self, head_db):
         """All 16 app tables + alembic_version are created at head."""
-        engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
-        with engine.begin() as conn:
-            command.upgrade(_test_cfg(conn), "head")
-
+        engine = create_engine(f"sqlite:///{head_db}")
         with engine.begin() as conn:
             tables = set(inspect(conn).get_table_names())
 
@@ -50,11 +90,11 @@ class TestMigrationChain:
         assert tables == expected
         engine.dispose()
 
-    def test_upgrade_then_downgrade_to_base(self, tmp_path):
+    def test_upgrade_then_downgrade_to_base(self, head_db, tmp_path):
         """Downgrade to base leaves only alembic_version (or empty)."""
-        engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
-        with engine.begin() as conn:
-            command.upgrade(_test_cfg(conn), "head")
+        db_path = tmp_path / "test.db"
+        shutil.copyfile(head_db, db_path)
+        engine = _scratch_engine(db_path)
         with engine.begin() as conn:
             command.downgrade(_test_cfg(conn), "base")
 
@@ -65,12 +105,9 @@ class TestMigrationChain:
         assert tables <= {"alembic_version"}
         engine.dispose()
 
-    def test_head_revision_is_007(self, tmp_path):
+    def test_head_revision_is_007(self, head_db):
         """Current migration head is revision 007."""
-        engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
-        with engine.begin() as conn:
-            command.upgrade(_test_cfg(conn), "head")
-
+        engine = create_engine(f"sqlite:///{head_db}")
         with engine.begin() as conn:
             row = conn.execute(text("SELECT version_num FROM alembic_version")).first()
 
@@ -78,33 +115,28 @@ class TestMigrationChain:
         assert row[0] == "007"
         engine.dispose()
 
-    def test_migration_schema_matches_create_all(self, tmp_path):
+    def test_migration_schema_matches_create_all(self, head_db):
         """Migration-created schema matches Base.metadata.create_all schema."""
         # DB 1: via migrations
-        engine_m = create_engine(f"sqlite:///{tmp_path / 'migration.db'}")
-        with engine_m.begin() as conn:
-            command.upgrade(_test_cfg(conn), "head")
+        engine_m = create_engine(f"sqlite:///{head_db}")
+        with engine_m.connect() as conn:
+            m_schema = _table_columns(conn)
+        m_schema.pop("alembic_version")
 
         # DB 2: via create_all
-        engine_c = create_engine(f"sqlite:///{tmp_path / 'create_all.db'}")
-        with engine_c.begin() as conn:
+        engine_c = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        with engine_c.connect() as conn:
             Base.metadata.create_all(conn)
+            c_schema = _table_columns(conn)
 
-        # Compare table names
-        with engine_m.begin() as conn:
-            m_insp = inspect(conn)
-            m_tables = set(m_insp.get_table_names()) - {"alembic_version"}
-            m_cols = {t: {c["name"] for c in m_insp.get_columns(t)} for t in m_tables}
+        assert m_schema.keys() == c_schema.keys(), (
+            f"Table mismatch: {m_schema.keys() ^ c_schema.keys()}"
+        )
 
-        with engine_c.begin() as conn:
-            c_insp = inspect(conn)
-            c_tables = set(c_insp.get_table_names())
-            c_cols = {t: {c["name"] for c in c_insp.get_columns(t)} for t in c_tables}
-
-        assert m_tables == c_tables, f"Table mismatch: {m_tables ^ c_tables}"
-
-        for table in m_tables:
-            assert m_cols[table] == c_cols[table], f"Column mismatch in '{table}'"
+        for table, columns in m_schema.items():
+            assert columns == c_schema[table], f"Column mismatch in '{table}'"
 
         engine_m.dispose()
         engine_c.dispose()
@@ -134,15 +166,12 @@ class TestEnsureDbMigrated:
             settings.vault_db_url = original_url
 
         # Verify: tables + alembic_version stamped at head
-        sync_engine = create_engine(f"sqlite:///{db_path}")
-        with sync_engine.begin() as conn:
-            tables = set(inspect(conn).get_table_names())
-            assert "api_keys" in tables
-            assert "users" in tables
-            assert "alembic_version" in tables
-            row = conn.execute(text("SELECT version_num FROM alembic_version")).first()
-            assert row[0] == "007"
-        sync_engine.dispose()
+        async with test_engine.connect() as conn:
+            tables, revision = await conn.run_sync(_tables_and_revision)
+        assert "api_keys" in tables
+        assert "users" in tables
+        assert "alembic_version" in tables
+        assert revision == "007"
         await test_engine.dispose()
 
     @pytest.mark.asyncio
@@ -151,7 +180,7 @@ class TestEnsureDbMigrated:
         db_path = tmp_path / "existing.db"
 
         # Pre-create tables via create_all (no alembic_version)
-        sync_engine = create_engine(f"sqlite:///{db_path}")
+        sync_engine = _scratch_engine(db_path)
         with sync_engine.begin() as conn:
             Base.metadata.create_all(conn)
         sync_engine.dispose()
@@ -170,14 +199,11 @@ class TestEnsureDbMigrated:
             settings.vault_db_url = original_url
 
         # Verify: alembic_version stamped at head, tables unchanged
-        sync_engine = create_engine(f"sqlite:///{db_path}")
-        with sync_engine.begin() as conn:
-            tables = set(inspect(conn).get_table_names())
-            assert "alembic_version" in tables
-            assert "api_keys" in tables
-            row = conn.execute(text("SELECT version_num FROM alembic_version")).first()
-            assert row[0] == "007"
-        sync_engine.dispose()
+        async with test_engine.connect() as conn:
+            tables, revision = await conn.run_sync(_tables_and_revision)
+        assert "alembic_version" in tables
+        assert "api_keys" in tables
+        assert revision == "007"
         await test_engine.dispose()
 
     @pytest.mark.asyncio
@@ -186,7 +212,7 @@ class TestEnsureDbMigrated:
         db_path = tmp_path / "tracked.db"
 
         # Create DB at revision 002 via connection injection
-        sync_engine = create_engine(f"sqlite:///{db_path}")
+        sync_engine = _scratch_engine(db_path)
         with sync_engine.begin() as conn:
             command.upgrade(_test_cfg(conn), "002")
         # Verify no adapters table yet (added in 003)
@@ -208,15 +234,12 @@ class TestEnsureDbMigrated:
             settings.vault_db_url = original_url
 
         # Verify: upgraded to head with adapters + eval_jobs + datasets + uptime_events tables
-        sync_engine = create_engine(f"sqlite:///{db_path}")
-        with sync_engine.begin() as conn:
-            tables = set(inspect(conn).get_table_names())
-            assert "adapters" in tables
-            assert "eval_jobs" in tables
-            assert "data_sources" in tables
-            assert "datasets" in tables
-            assert "uptime_events" in tables
-            row = conn.execute(text("SELECT version_num FROM alembic_version")).first()
-            assert row[0] == "007"
-        sync_engine.dispose()
+        async with test_engine.connect() as conn:
+            tables, revision = await conn.run_sync(_tables_and_revision)
+        assert "adapters" in tables
+        assert "eval_jobs" in tables
+        assert "data_sources" in tables
+        assert "datasets" in tables
+        assert "uptime_events" in tables
+        assert revision == "007"
         await test_engine.dispose()
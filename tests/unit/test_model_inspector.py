@@ -1,7 +1,7 @@
 """Unit tests for model inspector — config.json parsing for various architectures."""
 
 import json
-from pathlib import Path
+import shutil
 
 import pytest
 
@@ -9,53 +9,108 @@ from app.services.devmode import inspect_model
 from app.config import settings
 
 
+@pytest.fixture(scope="module")
+def manifest_file(tmp_path_factory):
+    """Write a manifest for "test-model" once and point settings at it."""
+    root = tmp_path_factory.mktemp("inspector")
+    manifest = {"models": [{"id": "test-model", "path": str(root / "test-model")}]}
+    manifest_path = root / "models.json"
+    manifest_path.write_text(json.dumps(manifest))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "vault_models_manifest", str(manifest_path))
+        yield manifest_path
+
+
 @pytest.fixture
-def model_dir(tmp_path):
-    """Create a temporary model directory and patch settings to use it."""
-    model_path = tmp_path / "test-model"
+def model_dir(manifest_file):
+    """Empty model directory for "test-model", recreated for every test."""
+    model_path = manifest_file.parent / "test-model"
+    shutil.rmtree(model_path, ignore_errors=True)
     model_path.mkdir()
     return model_path
 
 
 @pytest.fixture
-def manifest_file(tmp_path, model_dir):
-    """Create a manifest pointing to the model dir."""
-    manifest = {"models": [{"id": "test-model", "path": str(model_dir)}]}
-    manifest_path = tmp_path / "models.json"
-    manifest_path.write_text(json.dumps(manifest))
-    original = settings.vault_models_manifest
-    settings.vault_models_manifest = str(manifest_path)
-    yield manifest_path
-    settings.vault_models_manifest = original
-
-
-class TestInspectQwen2:
-    async def test_qwen2_architecture(self, model_dir, manifest_file):
-        config = {
-            "model_type": "qwen2",
-            "num_hidden_layers": 64,
-            "hidden_size": 5120,
-            "num_attention_heads": 40,
-            "num_key_value_heads": 8,
-            "intermediate_size": 27648,
-            "vocab_size": 152064,
-            "max_position_embeddings": 32768,
-            "rope_theta": 1000000.0,
-            "torch_dtype": "bfloat16",
-        }
-        (model_dir / "config.json").write_text(json.dumps(config))
-        (model_dir / "model.safetensors").write_bytes(b"\x00" * 100)
+def minimal_model(model_dir):
+    """model_dir holding an empty config.json and a 1-byte safetensors file."""
+    (model_dir / "config.json").write_text("{}")
+    (model_dir / "model.safetensors").write_bytes(b"\x00")
+    return model_dir
+
+
+class TestInspectArchitecture:
+    @pytest.mark.parametrize(
+        ("config", "expected"),
+        [
+            pytest.param(
+                {
+                    "model_type": "qwen2",
+                    "num_hidden_layers": 64,
+                    "hidden_size": 5120,
+                    "num_attention_heads": 40,
+                    "num_key_value_heads": 8,
+                    "intermediate_size": 27648,
+                    "vocab_size": 152064,
+                    "max_position_embeddings": 32768,
+                    "rope_theta": 1000000.0,
+                    "torch_dtype": "bfloat16",
+                },
+                {
+                    "model_type": "qwen2",
+                    "num_hidden_layers": 64,
+                    "hidden_size": 5120,
+                    "num_key_value_heads": 8,
+                    "rope_theta": 1000000.0,
+                },
+                id="qwen2",
+            ),
+            pytest.param(
+                {
+                    "model_type": "llama",
+                    "num_hidden_layers": 32,
+                    "hidden_size": 4096,
+                    "num_attention_heads": 32,
+                    "num_key_value_heads": 8,
+                    "intermediate_size": 14336,
+                    "vocab_size": 128256,
+                    "max_position_embeddings": 131072,
+                    "torch_dtype": "bfloat16",
+                },
+                {
+                    "model_type": "llama",
+                    "num_hidden_layers": 32,
+                    "max_position_embeddings": 131072,
+                },
+                id="llama",
+            ),
+            pytest.param(
+                {
+                    "model_type": "mistral",
+                    "num_hidden_layers": 32,
+                    "hidden_size": 4096,
+                    "num_attention_heads": 32,
+                    "num_key_value_heads": 8,
+                    "intermediate_size": 14336,
+                    "vocab_size": 32000,
+                    "max_position_embeddings": 32768,
+                },
+                {"model_type": "mistral", "vocab_size": 32000},
+                id="mistral",
+            ),
+        ],
+    )
+    async def test_architecture(self, minimal_model, config, expected):
+        (minimal_model / "config.json").write_text(json.dumps(config))
 
         result = await inspect_model("test-model")
 
-        assert result.architecture.model_type == "qwen2"
-        assert result.architecture.num_hidden_layers == 64
-        assert result.architecture.hidden_size == 5120
-        assert result.architecture.num_key_value_heads == 8
-        assert result.architecture.rope_theta == 1000000.0
+        for field, value in expected.items():
+            assert getattr(result.architecture, field) == value
 
-    async def test_awq_quantization(self, model_dir, manifest_file):
-        (model_dir / "config.json").write_text(json.dumps({"model_type": "qwen2"}))
+
+class TestInspectQuantization:
+    async def test_awq_quantization(self, minimal_model):
+        (minimal_model / "config.json").write_text(json.dumps({"model_type": "qwen2"}))
         quant = {
             "quant_method": "awq",
             "bits": 4,
@@ -63,8 +118,7 @@ class TestInspectQwen2:
             "zero_point": True,
             "version": "gemm",
         }
-        (model_dir / "quantize_config.json").write_text(json.dumps(quant))
-        (model_dir / "model.safetensors").write_bytes(b"\x00")
+        (minimal_model / "quantize_config.json").write_text(json.dumps(quant))
 
         result = await inspect_model("test-model")
 
@@ -74,52 +128,8 @@ class TestInspectQwen2:
         assert result.quantization.group_size == 128
 
 
-class TestInspectLlama:
-    async def test_llama_architecture(self, model_dir, manifest_file):
-        config = {
-            "model_type": "llama",
-            "num_hidden_layers": 32,
-            "hidden_size": 4096,
-            "num_attention_heads": 32,
-            "num_key_value_heads": 8,
-            "intermediate_size": 14336,
-            "vocab_size": 128256,
-            "max_position_embeddings": 131072,
-            "torch_dtype": "bfloat16",
-        }
-        (model_dir / "config.json").write_text(json.dumps(config))
-        (model_dir / "model.safetensors").write_bytes(b"\x00")
-
-        result = await inspect_model("test-model")
-
-        assert result.architecture.model_type == "llama"
-        assert result.architecture.num_hidden_layers == 32
-        assert result.architecture.max_position_embeddings == 131072
-
-
-class TestInspectMistral:
-    async def test_mistral_architecture(self, model_dir, manifest_file):
-        config = {
-            "model_type": "mistral",
-            "num_hidden_layers": 32,
-            "hidden_size": 4096,
-            "num_attention_heads": 32,
-            "num_key_value_heads": 8,
-            "intermediate_size": 14336,
-            "vocab_size": 32000,
-            "max_position_embeddings": 32768,
-        }
-        (model_dir / "config.json").write_text(json.dumps(config))
-        (model_dir / "model.safetensors").write_bytes(b"\x00")
-
-        result = await inspect_model("test-model")
-
-        assert result.architecture.model_type == "mistral"
-        assert result.architecture.vocab_size == 32000
-
-
 class TestInspectFiles:
-    async def test_safetensors_count(self, model_dir, manifest_file):
+    async def test_safetensors_count(self, model_dir):
         (model_dir / "config.json").write_text("{}")
         for i in range(5):
             (model_dir / f"model-{i:05d}.safetensors").write_bytes(b"\x00" * (1024 * i + 1))
@@ -129,22 +139,15 @@ class TestInspectFiles:
         assert result.files.safetensors_count == 5
         assert result.files.total_size_bytes > 0
 
-    async def test_tokenizer_detection(self, model_dir, manifest_file):
-        (model_dir / "config.json").write_text("{}")
-        (model_dir / "tokenizer.json").write_text("{}")
-        (model_dir / "model.safetensors").write_bytes(b"\x00")
-
-        result = await inspect_model("test-model")
-        assert result.files.has_tokenizer is True
-
-    async def test_no_tokenizer(self, model_dir, manifest_file):
-        (model_dir / "config.json").write_text("{}")
-        (model_dir / "model.safetensors").write_bytes(b"\x00")
+    @pytest.mark.parametrize("has_tokenizer", [True, False])
+    async def test_tokenizer_detection(self, minimal_model, has_tokenizer):
+        if has_tokenizer:
+            (minimal_model / "tokenizer.json").write_text("{}")
 
         result = await inspect_model("test-model")
-        assert result.files.has_tokenizer is False
+        assert result.files.has_tokenizer is has_tokenizer
 
-    async def test_inline_quantization_config(self, model_dir, manifest_file):
+    async def test_inline_quantization_config(self, minimal_model):
         """Test quantization info extracted from config.json's quantization_config field."""
         config = {
             "model_type": "llama",
@@ -154,8 +157,7 @@ class TestInspectFiles:
                 "group_size": 128,
             },
         }
-        (model_dir / "config.json").write_text(json.dumps(config))
-        (model_dir / "model.safetensors").write_bytes(b"\x00")
+        (minimal_model / "config.json").write_text(json.dumps(config))
 
         result = await inspect_model("test-model")
 
@@ -171,10 +173,9 @@ class TestInspectNotFound:
         with pytest.raises(NotFoundError):
             await inspect_model("nonexistent-model-xyz")
 
-    async def test_raw_config_returned(self, model_dir, manifest_file):
+    async def test_raw_config_returned(self, minimal_model):
         config = {"model_type": "custom", "custom_field": 42}
-        (model_dir / "config.json").write_text(json.dumps(config))
-        (model_dir / "model.safetensors").write_bytes(b"\x00")
+        (minimal_model / "config.json").write_text(json.dumps(config))
 
         result = await inspect_model("test-model")
         assert result.raw_config["custom_field"] == 42
@@ -1,19 +1,29 @@
 import json
+import shutil
 
 import pytest
-import pytest_asyncio
 
 from app.services.model_manager import ModelManager
 
 
-@pytest_asyncio.fixture
-async def manager(tmp_path):
-    """ModelManager wired to temp directories."""
-    models_dir = tmp_path / "models"
-    models_dir.mkdir()
+@pytest.fixture(scope="class")
+def _shared_manager(tmp_path_factory):
+    """ModelManager wired to temp directories, built once per test class."""
+    root = tmp_path_factory.mktemp("model-manager")
+    mgr = ModelManager()
+    mgr._models_dir = root / "models"
+    mgr._manifest_path = root / "models.json"
+    mgr._gpu_config_path = root / "gpu-config.yaml"
+    return mgr
+
 
-    manifest_path = tmp_path / "models.json"
-    manifest_path.write_text(json.dumps({
+@pytest.fixture
+def manager(_shared_manager):
+    """The class's ModelManager with its manifest, models dir and gpu-config reset."""
+    mgr = _shared_manager
+    shutil.rmtree(mgr._models_dir, ignore_errors=True)
+    mgr._models_dir.mkdir()
+    mgr._manifest_path.write_text(json.dumps({
         "models": [
             {
                 "id": "test-model-7b",
@@ -22,17 +32,11 @@ async def manager(tmp_path):
                 "quantization": "AWQ 4-bit",
                 "context_window": 4096,
                 "vram_required_gb": 5.0,
-                "path": str(models_dir / "test-model-7b"),
+                "path": str(mgr._models_dir / "test-model-7b"),
             }
         ]
     }))
-
-    gpu_config_path = tmp_path / "gpu-config.yaml"
-
-    mgr = ModelManager()
-    mgr._models_dir = models_dir
-    mgr._manifest_path = manifest_path
-    mgr._gpu_config_path = gpu_config_path
+    mgr._gpu_config_path.unlink(missing_ok=True)
     return mgr
 
 
@@ -67,14 +71,12 @@ class _FakeBackend:
 
 
 class TestListModels:
-    @pytest.mark.asyncio
     async def test_list_returns_manifest_models(self, manager):
         models = await manager.list_models()
         assert len(models) == 1
         assert models[0]["id"] == "test-model-7b"
         assert models[0]["status"] == "available"
 
-    @pytest.mark.asyncio
     async def test_list_empty_manifest(self, tmp_path):
         mgr = ModelManager()
         mgr._manifest_path = tmp_path / "nonexistent.json"
@@ -83,7 +85,6 @@ class TestListModels:
         models = await mgr.list_models()
         assert models == []
 
-    @pytest.mark.asyncio
     async def test_list_merges_backend_only_models(self, manager):
         """Backend-discovered models not in manifest appear as 'loaded'."""
         backend = _FakeBackend(
@@ -117,7 +118,6 @@ class TestListModels:
         assert cloud_model["name"] == "Gemini 2.0 Flash"
         assert cloud_model["context_window"] == 1048576
 
-    @pytest.mark.asyncio
     async def test_list_backend_failure_returns_manifest_only(self, manager):
         """If backend raises, manifest models still returned as 'available'."""
 
@@ -132,13 +132,11 @@ class TestListModels:
 
 
 class TestGetModel:
-    @pytest.mark.asyncio
     async def test_get_existing_model(self, manager):
         model = await manager.get_model("test-model-7b")
         assert model["id"] == "test-model-7b"
         assert model["name"] == "Test Model 7B"
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_raises_404(self, manager):
         from app.core.exceptions import NotFoundError
         with pytest.raises(NotFoundError):
@@ -146,7 +144,6 @@ class TestGetModel:
 
 
 class TestLoadModel:
-    @pytest.mark.asyncio
     async def test_load_existing_model(self, manager):
         result = await manager.load_model("test-model-7b", gpu_index=0)
         assert result["status"] == "loading"
@@ -158,13 +155,11 @@ class TestLoadModel:
         assert gpu_config["models"][0]["id"] == "test-model-7b"
         assert gpu_config["models"][0]["gpus"] == [0]
 
-    @pytest.mark.asyncio
     async def test_load_nonexistent_raises_404(self, manager):
         from app.core.exceptions import NotFoundError
         with pytest.raises(NotFoundError):
             await manager.load_model("nonexistent")
 
-    @pytest.mark.asyncio
     async def test_load_with_docker_client(self, manager):
         from tests.mocks.fake_docker import FakeDockerClient
         docker = FakeDockerClient()
@@ -173,7 +168,6 @@ class TestLoadModel:
 
 
 class TestUnloadModel:
-    @pytest.mark.asyncio
     async def test_unload_removes_from_gpu_config(self, manager):
         # Load first
         await manager.load_model("test-model-7b")
@@ -189,7 +183,6 @@ class TestUnloadModel:
 
 
 class TestImportModel:
-    @pytest.mark.asyncio
     async def test_import_valid_model(self, manager, tmp_path):
         # Create a valid model source directory
         source = tmp_path / "new-model-source"
@@ -206,7 +199,6 @@ class TestImportModel:
         ids = [m["id"] for m in manifest]
         assert "imported-model" in ids
 
-    @pytest.mark.asyncio
     async def test_import_uses_dir_name_as_id(self, manager, tmp_path):
         source = tmp_path / "my-cool-model"
         source.mkdir()
@@ -215,7 +207,6 @@ class TestImportModel:
         result = await manager.import_model(str(source))
         assert result["model_id"] == "my-cool-model"
 
-    @pytest.mark.asyncio
     async def test_import_rejects_pickle_files(self, manager, tmp_path):
         from app.core.exceptions import VaultError
 
@@ -229,7 +220,6 @@ class TestImportModel:
         assert exc_info.value.status == 400
         assert "Dangerous file" in exc_info.value.message
 
-    @pytest.mark.asyncio
     async def test_import_rejects_bin_files(self, manager, tmp_path):
         from app.core.exceptions import VaultError
 
@@ -242,7 +232,6 @@ class TestImportModel:
             await manager.import_model(str(source))
         assert exc_info.value.status == 400
 
-    @pytest.mark.asyncio
     async def test_import_rejects_no_config_or_safetensors(self, manager, tmp_path):
         from app.core.exceptions import VaultError
 
@@ -255,14 +244,12 @@ class TestImportModel:
         assert exc_info.value.status == 400
         assert "config.json" in exc_info.value.message
 
-    @pytest.mark.asyncio
     async def test_import_rejects_nonexistent_path(self, manager, tmp_path):
         from app.core.exceptions import NotFoundError
 
         with pytest.raises(NotFoundError):
             await manager.import_model(str(tmp_path / "does-not-exist"))
 
-    @pytest.mark.asyncio
     async def test_import_rejects_file_not_dir(self, manager, tmp_path):
         from app.core.exceptions import VaultError
 
@@ -273,7 +260,6 @@ class TestImportModel:
             await manager.import_model(str(file_path))
         assert exc_info.value.status == 400
 
-    @pytest.mark.asyncio
     async def test_import_rejects_duplicate_model_id(self, manager, tmp_path):
         from app.core.exceptions import VaultError
 
@@ -292,7 +278,6 @@ class TestImportModel:
 
 
 class TestDeleteModel:
-    @pytest.mark.asyncio
     async def test_delete_available_model(self, manager):
         # Create the model dir on disk
         model_dir = manager._models_dir / "test-model-7b"
@@ -316,7 +301,6 @@ class TestDeleteModel:
         # Verify removed from disk
         assert not model_dir.exists()
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_raises_404(self, manager):
         from app.core.exceptions import NotFoundError
         with pytest.raises(NotFoundError):
@@ -324,13 +308,11 @@ class TestDeleteModel:
 
 
 class TestActiveModels:
-    @pytest.mark.asyncio
     async def test_active_models_empty(self, manager):
         result = await manager.get_active_models()
         assert result["models"] == []
         assert result["gpu_allocation"] == []
 
-    @pytest.mark.asyncio
     async def test_active_models_after_load(self, manager):
         await manager.load_model("test-model-7b", gpu_index=0)
         result = await manager.get_active_models()